@@ -8,23 +8,91 @@ The Director is split into three LLM calls per turn:
 All three calls use the same director_llm manager with different prompt templates.
 """
 import json
-import re
-from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from models import Message, Agent
 from agents.STAGE.prompts.prompt_renderer import render as _render_prompt
+from agents.STAGE.prompts.prompt_renderer import compile_template, fill, load_template, substitute
 
 
 # Load unified templates at import time
-_PROMPTS_DIR = Path(__file__).parent / "prompts"
-_UPDATE_TEMPLATE = (_PROMPTS_DIR / "director_update_prompt.md").read_text(encoding="utf-8")
-_EVALUATE_TEMPLATE = (_PROMPTS_DIR / "director_evaluate_prompt.md").read_text(encoding="utf-8")
-_ACTION_TEMPLATE = (_PROMPTS_DIR / "director_action_prompt.md").read_text(encoding="utf-8")
+_UPDATE_TEMPLATE = load_template("director_update_prompt.md")
+_EVALUATE_TEMPLATE = load_template("director_evaluate_prompt.md")
+_ACTION_TEMPLATE = load_template("director_action_prompt.md")
+
+# User-prompt variants are rebuilt every turn; render their conditional
+# blocks and split out their placeholders once here, so each call is a
+# single fill pass.
+_UPDATE_USER_PARTS = compile_template(_render_prompt(_UPDATE_TEMPLATE, "user"))
+_EVALUATE_USER_PARTS = compile_template(_render_prompt(_EVALUATE_TEMPLATE, "user"))
+_ACTION_USER_PARTS = compile_template(_render_prompt(_ACTION_TEMPLATE, "user"))
+
+
+# Director action types, in the order they are reported in summaries.
+_ACTION_TYPES = ("message", "reply", "@mention", "like")
+_VALID_ACTION_TYPES = frozenset(_ACTION_TYPES)
+_INSTRUCTION_KEYS = frozenset({"objective", "motivation", "directive"})
+
+_DECODER = json.JSONDecoder()
+
+
+def _fenced_body(raw: str) -> Optional[str]:
+    """Return the stripped body of the first ```json ... ``` (or bare ```) block, if any."""
+    start = raw.find("```")
+    if start == -1:
+        return None
+    start += 3
+    if raw.startswith("json", start):
+        start += 4
+    end = raw.find("```", start)
+    if end == -1:
+        return None
+    return raw[start:end].strip()
+
+
+def _extract_json(raw: str, call_name: str) -> dict:
+    """Parse the JSON object in a Director response (fenced or bare).
+
+    Raises ValueError naming *call_name* if the payload is not valid JSON.
+    """
+    stripped = raw.strip()
+    # Fast path: a well-behaved model returns bare JSON, so skip the fence scan.
+    if stripped.startswith("{"):
+        try:
+            return _DECODER.raw_decode(stripped)[0]
+        except json.JSONDecodeError:
+            pass
+
+    json_str = _fenced_body(raw)
+    if json_str is None:
+        json_str = stripped
+
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Director {call_name} response is not valid JSON: {e}\nRaw: {raw[:500]}")
 
 
 # ── Chat log formatting ─────────────────────────────────────────────────────
 
+def _format_line(m: Message, include_likes: bool = True) -> str:
+    """Format one message as a chat log line: ``[id] sender (meta): content``."""
+    # Most messages carry no metadata; skip building the meta list for them.
+    if not (m.reply_to or m.mentions or (include_likes and m.liked_by)):
+        return f"[{m.message_id}] {m.sender}: {m.content}"
+
+    meta = []
+    if m.reply_to:
+        meta.append(f"replying to {m.reply_to}")
+    if m.mentions:
+        meta.append(f"@mentions {', '.join(m.mentions)}")
+    if include_likes and m.liked_by:
+        meta.append(f"liked by {', '.join(sorted(m.liked_by))}")
+
+    return f"[{m.message_id}] {m.sender} ({'; '.join(meta)}): {m.content}"
+
+
 def format_chat_log(messages: List[Message]) -> str:
     """Format messages into a chat log string the Director can reason over.
 
@@ -33,21 +101,7 @@ def format_chat_log(messages: List[Message]) -> str:
     """
     if not messages:
         return "(No messages yet)"
-
-    lines = []
-    for m in messages:
-        meta = []
-        if m.reply_to:
-            meta.append(f"replying to {m.reply_to}")
-        if m.mentions:
-            meta.append(f"@mentions {', '.join(m.mentions)}")
-        if m.liked_by:
-            meta.append(f"liked by {', '.join(sorted(m.liked_by))}")
-
-        meta_str = f" ({'; '.join(meta)})" if meta else ""
-        line = f"[{m.message_id}] {m.sender}{meta_str}: {m.content}"
-        lines.append(line)
-    return "\n".join(lines)
+    return "\n".join(_format_line(m) for m in messages)
 
 
 def format_agent_profiles(profiles: Dict[str, str]) -> str:
@@ -66,11 +120,12 @@ def format_agent_profiles(profiles: Dict[str, str]) -> str:
 
 # ── Update prompts (Call 1) ─────────────────────────────────────────────────
 
+@lru_cache(maxsize=64)
 def build_update_system_prompt(chatroom_context: str = "") -> str:
     """Build the Director Update system prompt (session-static)."""
-    prompt = _render_prompt(_UPDATE_TEMPLATE, "system")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    return prompt
+    return substitute(_render_prompt(_UPDATE_TEMPLATE, "system"), {
+        "CHATROOM_CONTEXT": chatroom_context,
+    })
 
 
 def format_last_action(message: Optional[Message]) -> str:
@@ -80,15 +135,7 @@ def format_last_action(message: Optional[Message]) -> str:
     """
     if message is None:
         return "(No action to display)"
-
-    meta = []
-    if message.reply_to:
-        meta.append(f"replying to {message.reply_to}")
-    if message.mentions:
-        meta.append(f"@mentions {', '.join(message.mentions)}")
-
-    meta_str = f" ({'; '.join(meta)})" if meta else ""
-    return f"[{message.message_id}] {message.sender}{meta_str}: {message.content}"
+    return _format_line(message, include_likes=False)
 
 
 def build_update_user_prompt(
@@ -101,13 +148,12 @@ def build_update_user_prompt(
     action_str = format_last_action(last_action)
     profile_str = last_agent_profile or "(This performer has not acted yet.)"
 
-    prompt = _render_prompt(_UPDATE_TEMPLATE, "user")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    prompt = prompt.replace("{LAST_AGENT}", last_agent)
-    prompt = prompt.replace("{LAST_AGENT_PROFILE}", profile_str)
-    prompt = prompt.replace("{LAST_ACTION}", action_str)
-
-    return prompt
+    return fill(_UPDATE_USER_PARTS, {
+        "CHATROOM_CONTEXT": chatroom_context,
+        "LAST_AGENT": last_agent,
+        "LAST_AGENT_PROFILE": profile_str,
+        "LAST_ACTION": action_str,
+    })
 
 
 def parse_update_response(raw: str) -> dict:
@@ -115,13 +161,7 @@ def parse_update_response(raw: str) -> dict:
 
     Returns dict with key: performer_profile_update
     """
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", raw, re.DOTALL)
-    json_str = fence_match.group(1).strip() if fence_match else raw.strip()
-
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Director Update response is not valid JSON: {e}\nRaw: {raw[:500]}")
+    data = _extract_json(raw, "Update")
 
     if "performer_profile_update" not in data:
         raise ValueError("Director Update response missing 'performer_profile_update'")
@@ -131,17 +171,18 @@ def parse_update_response(raw: str) -> dict:
 
 # ── Evaluate prompts (Call 2) ───────────────────────────────────────────────
 
+@lru_cache(maxsize=64)
 def build_evaluate_system_prompt(
     internal_validity_criteria: str,
     ecological_criteria: str,
     chatroom_context: str = "",
 ) -> str:
     """Build the Director Evaluate system prompt (session-static)."""
-    prompt = _render_prompt(_EVALUATE_TEMPLATE, "system")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    prompt = prompt.replace("{INTERNAL_VALIDITY_CRITERIA}", internal_validity_criteria)
-    prompt = prompt.replace("{ECOLOGICAL_VALIDITY_CRITERIA}", ecological_criteria)
-    return prompt
+    return substitute(_render_prompt(_EVALUATE_TEMPLATE, "system"), {
+        "CHATROOM_CONTEXT": chatroom_context,
+        "INTERNAL_VALIDITY_CRITERIA": internal_validity_criteria,
+        "ECOLOGICAL_VALIDITY_CRITERIA": ecological_criteria,
+    })
 
 
 def format_participation_summary(
@@ -175,7 +216,7 @@ def format_action_summary(action_counts: Dict[str, int]) -> str:
         return "(No actions yet)"
 
     parts = []
-    for action_type in ["message", "reply", "@mention", "like"]:
+    for action_type in _ACTION_TYPES:
         count = action_counts.get(action_type, 0)
         pct = round(100 * count / total) if total else 0
         parts.append(f"{count} {action_type} ({pct}%)")
@@ -200,17 +241,16 @@ def build_evaluate_user_prompt(
     action_summary = format_action_summary(action_counts) if action_counts else "(No actions yet)"
     participation_summary = format_participation_summary(performer_counts, exclude_performer=exclude_performer) if performer_counts else "(No actions yet)"
 
-    prompt = _render_prompt(_EVALUATE_TEMPLATE, "user")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    prompt = prompt.replace("{INTERNAL_VALIDITY_CRITERIA}", internal_validity_criteria)
-    prompt = prompt.replace("{ECOLOGICAL_VALIDITY_CRITERIA}", ecological_criteria)
-    prompt = prompt.replace("{PREVIOUS_INTERNAL_VALIDITY_EVALUATION}", prev_internal)
-    prompt = prompt.replace("{PREVIOUS_ECOLOGICAL_VALIDITY_EVALUATION}", prev_ecological)
-    prompt = prompt.replace("{ACTION_SUMMARY}", action_summary)
-    prompt = prompt.replace("{PARTICIPATION_SUMMARY}", participation_summary)
-    prompt = prompt.replace("{RECENT_CHAT_LOG}", chat_log)
-
-    return prompt
+    return fill(_EVALUATE_USER_PARTS, {
+        "CHATROOM_CONTEXT": chatroom_context,
+        "INTERNAL_VALIDITY_CRITERIA": internal_validity_criteria,
+        "ECOLOGICAL_VALIDITY_CRITERIA": ecological_criteria,
+        "PREVIOUS_INTERNAL_VALIDITY_EVALUATION": prev_internal,
+        "PREVIOUS_ECOLOGICAL_VALIDITY_EVALUATION": prev_ecological,
+        "ACTION_SUMMARY": action_summary,
+        "PARTICIPATION_SUMMARY": participation_summary,
+        "RECENT_CHAT_LOG": chat_log,
+    })
 
 
 def parse_evaluate_response(raw: str) -> dict:
@@ -218,13 +258,7 @@ def parse_evaluate_response(raw: str) -> dict:
 
     Returns dict with keys: internal_validity_evaluation, ecological_validity_evaluation
     """
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", raw, re.DOTALL)
-    json_str = fence_match.group(1).strip() if fence_match else raw.strip()
-
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Director Evaluate response is not valid JSON: {e}\nRaw: {raw[:500]}")
+    data = _extract_json(raw, "Evaluate")
 
     required = ["internal_validity_evaluation", "ecological_validity_evaluation"]
     for key in required:
@@ -236,15 +270,16 @@ def parse_evaluate_response(raw: str) -> dict:
 
 # ── Action prompts (Call 3) ─────────────────────────────────────────────────
 
+@lru_cache(maxsize=64)
 def build_action_system_prompt(chatroom_context: str = "") -> str:
     """Build the Director Action system prompt (session-static).
 
     The Action call does NOT receive raw validity criteria —
     it receives the evaluations from Call 2 instead.
     """
-    prompt = _render_prompt(_ACTION_TEMPLATE, "system")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    return prompt
+    return substitute(_render_prompt(_ACTION_TEMPLATE, "system"), {
+        "CHATROOM_CONTEXT": chatroom_context,
+    })
 
 
 def format_skip_feedback(
@@ -289,16 +324,15 @@ def build_action_user_prompt(
     participation_summary = format_participation_summary(performer_counts, exclude_performer=exclude_performer) if performer_counts else "(No actions yet)"
     skip_feedback = format_skip_feedback(skipped_performer, consecutive_skips)
 
-    prompt = _render_prompt(_ACTION_TEMPLATE, "user")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    prompt = prompt.replace("{INTERNAL_VALIDITY_SUMMARY}", internal_validity_summary)
-    prompt = prompt.replace("{ECOLOGICAL_VALIDITY_SUMMARY}", ecological_validity_summary)
-    prompt = prompt.replace("{AGENT_PROFILES}", profiles_str)
-    prompt = prompt.replace("{PARTICIPATION_SUMMARY}", participation_summary)
-    prompt = prompt.replace("{SKIP_FEEDBACK}", skip_feedback)
-    prompt = prompt.replace("{CHAT_LOG}", chat_log)
-
-    return prompt
+    return fill(_ACTION_USER_PARTS, {
+        "CHATROOM_CONTEXT": chatroom_context,
+        "INTERNAL_VALIDITY_SUMMARY": internal_validity_summary,
+        "ECOLOGICAL_VALIDITY_SUMMARY": ecological_validity_summary,
+        "AGENT_PROFILES": profiles_str,
+        "PARTICIPATION_SUMMARY": participation_summary,
+        "SKIP_FEEDBACK": skip_feedback,
+        "CHAT_LOG": chat_log,
+    })
 
 
 def parse_action_response(raw: str) -> dict:
@@ -308,13 +342,7 @@ def parse_action_response(raw: str) -> dict:
         next_performer, action_type, target_user, target_message_id, performer_instruction,
         priority, performer_rationale, action_rationale
     """
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", raw, re.DOTALL)
-    json_str = fence_match.group(1).strip() if fence_match else raw.strip()
-
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Director Action response is not valid JSON: {e}\nRaw: {raw[:500]}")
+    data = _extract_json(raw, "Action")
 
     # Validate required fields
     if "next_performer" not in data:
@@ -323,9 +351,11 @@ def parse_action_response(raw: str) -> dict:
         raise ValueError("Director Action response missing 'action_type'")
 
     action_type = data["action_type"]
-    valid_types = {"message", "reply", "@mention", "like"}
-    if action_type not in valid_types:
-        raise ValueError(f"Director returned invalid action_type: '{action_type}'. Must be one of {valid_types}")
+    if action_type not in _VALID_ACTION_TYPES:
+        raise ValueError(
+            f"Director returned invalid action_type: '{action_type}'. "
+            f"Must be one of {set(_ACTION_TYPES)}"
+        )
 
     # Validate target fields based on action type
     if action_type == "reply" and not data.get("target_message_id"):
@@ -342,7 +372,7 @@ def parse_action_response(raw: str) -> dict:
             raise ValueError(f"Director chose '{action_type}' but did not provide 'performer_instruction'")
         if not isinstance(pi, dict):
             raise ValueError(f"performer_instruction must be a dict, got {type(pi).__name__}")
-        missing = {"objective", "motivation", "directive"} - pi.keys()
+        missing = _INSTRUCTION_KEYS - pi.keys()
         if missing:
             raise ValueError(f"performer_instruction missing keys: {missing}")
 
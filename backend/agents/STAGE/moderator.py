@@ -3,31 +3,34 @@
 Strips formatting artifacts and meta-commentary from the Performer's raw
 output, returning only the clean chatroom message content.
 """
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
+from agents.STAGE.prompts.prompt_renderer import compile_template, fill, load_template, substitute
+from agents.STAGE.prompts.prompt_renderer import render as _render_prompt
+
 # Sentinel value the Moderator returns when no valid message content is found
 NO_CONTENT = "NO_CONTENT"
 
 # Load unified Moderator prompt template at import time
-_PROMPTS_DIR = Path(__file__).parent / "prompts"
-_UNIFIED_TEMPLATE = (_PROMPTS_DIR / "moderator_prompt.md").read_text(encoding="utf-8")
+_UNIFIED_TEMPLATE = load_template("moderator_prompt.md")
 
-from agents.STAGE.prompts.prompt_renderer import render as _render_prompt
+# The user variant is rebuilt for every Performer attempt — render it and
+# split out its placeholders once.
+_USER_PARTS = compile_template(_render_prompt(_UNIFIED_TEMPLATE, "user"))
 
 
+@lru_cache(maxsize=64)
 def build_moderator_system_prompt(chatroom_context: str = "") -> str:
     """Build the Moderator system prompt (session-static)."""
-    prompt = _render_prompt(_UNIFIED_TEMPLATE, "system")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    return prompt
+    return substitute(_render_prompt(_UNIFIED_TEMPLATE, "system"), {
+        "CHATROOM_CONTEXT": chatroom_context,
+    })
 
 
 def build_moderator_user_prompt(performer_output: str) -> str:
     """Build the per-turn user prompt with the Performer's raw output."""
-    prompt = _render_prompt(_UNIFIED_TEMPLATE, "user")
-    prompt = prompt.replace("{PERFORMER_OUTPUT}", performer_output)
-    return prompt
+    return fill(_USER_PARTS, {"PERFORMER_OUTPUT": performer_output})
 
 
 def parse_moderator_response(raw: str) -> Optional[str]:
@@ -4,6 +4,7 @@ Each turn:
   1. (Skip on first turn) Director Update: update last agent's profile
   2. Director Evaluate: assess validity criteria (every turn during warm-up,
      then every evaluate_interval turns once the first full interval completes)
+     — Update and Evaluate are independent and run concurrently.
   3. Director Action: select performer, action type, target, generate O/M/D
      — If the Director selects the human participant, the turn short-circuits
        here: Performer/Moderator are skipped, and the evaluate counter is
@@ -17,6 +18,7 @@ Each turn:
 Agent profiles accumulate over the session, updated by the Update call.
 All names are anonymized before LLM calls and deanonymized in the output.
 """
+import asyncio
 import random
 import re
 from copy import copy
@@ -31,11 +33,19 @@ from agents.STAGE.director import (
     build_action_system_prompt, build_action_user_prompt, parse_action_response,
 )
 from agents.STAGE.performer import build_performer_system_prompt, build_performer_user_prompt
-from agents.STAGE.moderator import build_moderator_system_prompt, build_moderator_user_prompt, parse_moderator_response
+from agents.STAGE.moderator import (
+    NO_CONTENT,
+    build_moderator_system_prompt,
+    build_moderator_user_prompt,
+    parse_moderator_response,
+)
 
 
 MAX_PERFORMER_RETRIES = 3
 
+# Anonymized copies kept for reuse across turns (oldest evicted first).
+ANON_CACHE_SIZE = 256
+
 
 @dataclass
 class TurnResult:
@@ -68,21 +78,29 @@ def build_name_map(agent_names: List[str], user_name: str, rng: random.Random) -
     return {name: f"Performer {i + 1}" for i, name in enumerate(all_names)}
 
 
-def anonymize_message(msg: Message, name_map: Dict[str, str]) -> Message:
-    """Return a shallow copy of a Message with sender/mentions/content anonymized."""
+def anonymize_message(
+    msg: Message,
+    name_map: Dict[str, str],
+    pattern: Optional[re.Pattern] = None,
+) -> Message:
+    """Return a shallow copy of a Message with sender/mentions/content anonymized.
+
+    *pattern* is an optional precomputed ``_name_pattern(name_map)``.
+    """
     anon = copy(msg)
     anon.sender = name_map.get(msg.sender, msg.sender)
 
     if msg.mentions:
         anon.mentions = [name_map.get(m, m) for m in msg.mentions]
 
-    if msg.liked_by:
-        anon.liked_by = {name_map.get(u, u) for u in msg.liked_by}
+    # Always a fresh set: a shallow copy would otherwise share the original's
+    # (possibly empty) set and see real names added by later likes.
+    anon.liked_by = {name_map.get(u, u) for u in msg.liked_by}
 
-    anon.content = _replace_names_in_text(msg.content, name_map)
+    anon.content = _replace_names_in_text(msg.content, name_map, pattern)
 
     if msg.quoted_text:
-        anon.quoted_text = _replace_names_in_text(msg.quoted_text, name_map)
+        anon.quoted_text = _replace_names_in_text(msg.quoted_text, name_map, pattern)
 
     return anon
 
@@ -92,18 +110,53 @@ def anonymize_agents(agents: List[Agent], name_map: Dict[str, str]) -> List[Agen
     return [Agent(name=name_map.get(a.name, a.name)) for a in agents]
 
 
-def _replace_names_in_text(text: str, name_map: Dict[str, str]) -> str:
-    """Replace all occurrences of real names in text with their anonymous labels."""
+def _name_pattern(name_map: Dict[str, str]) -> Optional[re.Pattern]:
+    """Compile one alternation matching any name in the map, longest name first.
+
+    Longest-first ordering makes "Performer 10" win over "Performer 1".
+    Returns None when there is nothing to match.
+    """
+    names = sorted((n for n in name_map if n), key=len, reverse=True)
+    if not names:
+        return None
+    return re.compile("|".join(map(re.escape, names)))
+
+
+def _replace_names_in_text(
+    text: str,
+    name_map: Dict[str, str],
+    pattern: Optional[re.Pattern] = None,
+) -> str:
+    """Replace all occurrences of real names in text with their anonymous labels.
+
+    All names are replaced in a single scan, so a replacement is never
+    itself rewritten by a later name.
+    """
     if not text:
         return text
-    for real, anon in sorted(name_map.items(), key=lambda x: -len(x[0])):
-        text = text.replace(real, anon)
-    return text
+    if pattern is None:
+        pattern = _name_pattern(name_map)
+        if pattern is None:
+            return text
+    return pattern.sub(lambda m: name_map[m.group(0)], text)
+
+
+def deanonymize_text(
+    text: str,
+    reverse_map: Dict[str, str],
+    pattern: Optional[re.Pattern] = None,
+) -> str:
+    """Replace anonymous labels in text back to real names."""
+    return _replace_names_in_text(text, reverse_map, pattern)
 
 
-def deanonymize_text(text: str, reverse_map: Dict[str, str]) -> str:
-    """Replace anonymous labels in text back to real names."""
-    return _replace_names_in_text(text, reverse_map)
+def _strip_mention_prefix(text: str, name: str) -> str:
+    """Remove a leading '@name' (or bare 'name') from text and trim whitespace."""
+    if text.startswith("@" + name):
+        text = text[len(name) + 1:]
+    elif text.startswith(name):
+        text = text[len(name):]
+    return text.strip()
 
 
 class Orchestrator:
@@ -138,11 +191,19 @@ class Orchestrator:
         self.chatroom_context = chatroom_context
         self.ecological_criteria = ecological_criteria
 
+        # Session RNG: shuffles the name mapping and picks fallback agents,
+        # so a seeded session is reproducible end to end.
+        self._rng = rng or random.Random()
+
         # Build the shuffled name mapping (stable for the session lifetime).
-        _rng = rng or random.Random()
         agent_names = [a.name for a in state.agents]
-        self._name_map = build_name_map(agent_names, state.user_name, _rng)
+        self._name_map = build_name_map(agent_names, state.user_name, self._rng)
         self._reverse_map = {v: k for k, v in self._name_map.items()}
+        # Longest-first replacement order, computed once rather than per message.
+        self._anon_pattern = _name_pattern(self._name_map)
+        self._deanon_pattern = _name_pattern(self._reverse_map)
+        # Case-folded labels, for Director output like "performer 2".
+        self._reverse_map_folded = {k.casefold(): v for k, v in self._reverse_map.items()}
         self._anon_user = self._name_map[state.user_name]
 
         # Performer profiles: keyed by anonymous name, values are free-form text.
@@ -202,9 +263,31 @@ class Orchestrator:
         self._evaluate_system_prompt: Optional[str] = None
         self._action_system_prompt: Optional[str] = None
 
+        # message_id -> (likers at copy time, anonymized copy).  The sliding
+        # windows re-read mostly the same messages each turn; only likes
+        # change a message after it is posted.
+        self._anon_cache: Dict[str, tuple] = {}
+
+    def _anonymize(self, msg: Message) -> Message:
+        """Anonymize a message with this session's name map (cached per message)."""
+        cached = self._anon_cache.get(msg.message_id)
+        if cached is not None and cached[0] == msg.liked_by:
+            return cached[1]
+        anon = anonymize_message(msg, self._name_map, self._anon_pattern)
+        if cached is None and len(self._anon_cache) >= ANON_CACHE_SIZE:
+            del self._anon_cache[next(iter(self._anon_cache))]
+        self._anon_cache[msg.message_id] = (frozenset(msg.liked_by), anon)
+        return anon
+
     def _deanon_name(self, anon_name: str) -> str:
-        """Map an anonymous label back to the real name."""
-        return self._reverse_map.get(anon_name, anon_name)
+        """Map an anonymous label back to the real name.
+
+        Falls back to a case-insensitive match; unknown labels are returned as-is.
+        """
+        real = self._reverse_map.get(anon_name)
+        if real is None and isinstance(anon_name, str):
+            real = self._reverse_map_folded.get(anon_name.strip().casefold())
+        return anon_name if real is None else real
 
     def _log_turn_result(self, result: TurnResult) -> None:
         """Log a structured turn_result event to the DB."""
@@ -245,7 +328,7 @@ class Orchestrator:
         recent_action = self.state.get_recent_messages(self.action_window_size)
         agents = self.state.agents
 
-        anon_recent_action = [anonymize_message(m, self._name_map) for m in recent_action]
+        anon_recent_action = [self._anonymize(m) for m in recent_action]
 
         # 1b. Detect if the human posted since the last orchestrator turn.
         #     If the most recent message is from the human, treat them as the
@@ -257,11 +340,16 @@ class Orchestrator:
             self._consecutive_skips = 0
             self._last_skipped_performer = None
 
-        # 2. Director Update (skip on first turn — nothing to assess)
+        # 2. Director Update and Evaluate are independent of each other
+        #    (Evaluate does not read profiles), so their LLM calls run
+        #    concurrently.  Action (step 3) needs both results.
+        director_calls = []
+
+        # 2a. Director Update (skip on first turn — nothing to assess)
         if anon_recent_action and self._last_agent:
             # Skip Update for likes — they aren't significant enough for a profile revision.
             if self._last_action_type != "like":
-                await self._director_update(anon_recent_action)
+                director_calls.append(self._director_update(anon_recent_action))
 
         # 2b. Director Evaluate
         #     Before the first full interval fires, evaluate every turn so the
@@ -277,11 +365,17 @@ class Orchestrator:
         )
         if should_evaluate:
             recent_eval = self.state.get_recent_messages(self.evaluate_interval)
-            anon_recent_eval = [anonymize_message(m, self._name_map) for m in recent_eval]
-            await self._director_evaluate(internal_validity_criteria, anon_recent_eval)
-            if self._turns_since_evaluate >= self.evaluate_interval:
-                self._has_completed_first_interval = True
-                self._turns_since_evaluate = 0
+            anon_recent_eval = [self._anonymize(m) for m in recent_eval]
+            director_calls.append(
+                self._director_evaluate(internal_validity_criteria, anon_recent_eval)
+            )
+
+        if director_calls:
+            await asyncio.gather(*director_calls)
+
+        if should_evaluate and self._turns_since_evaluate >= self.evaluate_interval:
+            self._has_completed_first_interval = True
+            self._turns_since_evaluate = 0
 
         # 3. Director Action
         #    The Director selects from all performers visible in profiles/chat log.
@@ -334,29 +428,29 @@ class Orchestrator:
         if not agents:
             self.logger.log_error("director_agent", "No agents available for this session")
             return None
-        if not any(a.name == agent_name for a in agents):
-            fallback = random.choice(agents).name
+        if self.state.get_agent(agent_name) is None:
+            fallback = self._rng.choice(agents).name
             self.logger.log_error(
                 "director_agent",
                 f"Director chose unknown agent '{agent_name}'; falling back to '{fallback}'",
             )
             agent_name = fallback
 
+        # The selected agent's anonymous label, used throughout the rest of the turn.
+        anon_agent_name = self._name_map.get(agent_name, agent_name)
+
         # Track last agent and action type for next turn's Update call (use anonymous name).
         # Save previous values so we can restore on performer failure (silent skip).
         _saved_last_agent = self._last_agent
         _saved_last_action_type = self._last_action_type
-        self._last_agent = self._name_map.get(agent_name, action_data["next_performer"])
+        self._last_agent = anon_agent_name
         self._last_action_type = action_type
 
         # 4. Handle 'like' actions (no Performer call needed)
         if action_type == "like":
             # Guard: skip duplicate likes (agent already liked this message).
             if target_message_id:
-                target_msg = next(
-                    (m for m in self.state.messages if m.message_id == target_message_id),
-                    None,
-                )
+                target_msg = self.state.get_message(target_message_id)
                 if target_msg and agent_name in (target_msg.liked_by or set()):
                     self.logger.log_error(
                         "director_duplicate_like",
@@ -377,8 +471,9 @@ class Orchestrator:
                     return result
 
             self._action_counts["like"] += 1
-            anon_name = self._name_map.get(agent_name, agent_name)
-            self._performer_counts[anon_name] = self._performer_counts.get(anon_name, 0) + 1
+            self._performer_counts[anon_agent_name] = (
+                self._performer_counts.get(anon_agent_name, 0) + 1
+            )
             self._consecutive_skips = 0
             self._last_skipped_performer = None
             result = TurnResult(
@@ -396,7 +491,6 @@ class Orchestrator:
         performer_instruction = action_data.get("performer_instruction", {})
 
         # Get the selected agent's profile (in anonymous space)
-        anon_agent_name = self._name_map.get(agent_name, agent_name)
         agent_profile = self.agent_profiles.get(anon_agent_name, "")
 
         # Look up target message if needed, and prepare an anon copy.
@@ -405,19 +499,13 @@ class Orchestrator:
         target_message = None
         anon_target_message = None
         if target_message_id:
-            target_message = next(
-                (m for m in self.state.messages if m.message_id == target_message_id),
-                None,
-            )
+            target_message = self.state.get_message(target_message_id)
         elif action_type == "message" and target_user:
             # Director chose a targeted message but no explicit message_id —
             # resolve the target user's most recent message.
-            for m in reversed(self.state.messages):
-                if m.sender == target_user:
-                    target_message = m
-                    break
+            target_message = self.state.last_message_from(target_user)
         if target_message:
-            anon_target_message = anonymize_message(target_message, self._name_map)
+            anon_target_message = self._anonymize(target_message)
 
         # Resolve anonymous target_user for the performer prompt
         anon_target_user = None
@@ -425,14 +513,10 @@ class Orchestrator:
             anon_target_user = self._name_map.get(target_user, target_user)
 
         # Gather this performer's recent messages (anonymized) so it can avoid repetition.
-        anon_recent_by_agent = []
-        if self.performer_memory_size > 0:
-            for m in reversed(self.state.messages):
-                if m.sender == agent_name:
-                    anon_recent_by_agent.append(anonymize_message(m, self._name_map))
-                    if len(anon_recent_by_agent) >= self.performer_memory_size:
-                        break
-            anon_recent_by_agent.reverse()
+        anon_recent_by_agent = [
+            self._anonymize(m)
+            for m in self.state.recent_messages_from(agent_name, self.performer_memory_size)
+        ]
 
         performer_user_prompt = build_performer_user_prompt(
             instruction=performer_instruction,
@@ -445,28 +529,25 @@ class Orchestrator:
         )
 
         content = None
-
         for attempt in range(1, MAX_PERFORMER_RETRIES + 1):
             # 5a. Call the Performer
-            performer_raw = None
-            try:
-                performer_raw = await self.performer_llm.generate_response(
-                    performer_user_prompt, max_retries=1,
-                    system_prompt=self._performer_system_prompt,
-                )
-            except Exception as e:
-                self.logger.log_error("performer_llm_call", str(e))
-
-            self.logger.log_llm_call(
-                agent_name=agent_name,
-                prompt=f"[SYSTEM]\n{self._performer_system_prompt}\n\n[USER]\n{performer_user_prompt}",
-                response=performer_raw,
-                error=None if performer_raw else f"Performer LLM returned no response (attempt {attempt}/{MAX_PERFORMER_RETRIES})",
+            performer_raw = await self._call_performer(
+                performer_user_prompt, agent_name, attempt,
             )
 
             if not performer_raw:
                 continue
 
+            # Blank or NO_CONTENT output can't yield a message — reject it
+            # locally instead of spending a Moderator round trip on it.
+            if performer_raw.strip() in ("", NO_CONTENT):
+                self.logger.log_error(
+                    "performer_no_content",
+                    f"Performer returned no usable output "
+                    f"(attempt {attempt}/{MAX_PERFORMER_RETRIES})",
+                )
+                continue
+
             # 5b. Call the Moderator to extract clean content
             moderator_user_prompt = build_moderator_user_prompt(
                 performer_output=performer_raw,
@@ -483,7 +564,8 @@ class Orchestrator:
 
             self.logger.log_llm_call(
                 agent_name="__moderator__",
-                prompt=f"[SYSTEM]\n{self._moderator_system_prompt}\n\n[USER]\n{moderator_user_prompt}",
+                system_prompt=self._moderator_system_prompt,
+                user_prompt=moderator_user_prompt,
                 response=moderator_raw,
                 error=None if moderator_raw else f"Moderator LLM returned no response (attempt {attempt}/{MAX_PERFORMER_RETRIES})",
             )
@@ -521,16 +603,7 @@ class Orchestrator:
             return result
 
         # 6. Deanonymize any anonymous labels in the generated content.
-        content = deanonymize_text(content, self._reverse_map)
-
-        # 6b. Strip any @mention prefix the Performer included — the
-        #     Orchestrator adds it canonically below, so duplicates must go.
-        if action_type == "@mention" and target_user:
-            content = re.sub(
-                r"^@?" + re.escape(target_user) + r"\s*",
-                "",
-                content,
-            ).strip()
+        content = deanonymize_text(content, self._reverse_map, self._deanon_pattern)
 
         # 7. Format the output into a Message
         mentions = None
@@ -538,7 +611,9 @@ class Orchestrator:
         quoted_text = None
 
         if action_type == "@mention" and target_user:
-            content = f"@{target_user} {content}"
+            # Strip any @mention prefix the Performer included and add it
+            # canonically, so the message never carries a duplicate.
+            content = f"@{target_user} {_strip_mention_prefix(content, target_user)}"
             mentions = [target_user]
         elif action_type == "reply" and target_message_id:
             reply_to = target_message_id
@@ -554,8 +629,9 @@ class Orchestrator:
         )
 
         self._action_counts[action_type] = self._action_counts.get(action_type, 0) + 1
-        anon_name = self._name_map.get(agent_name, agent_name)
-        self._performer_counts[anon_name] = self._performer_counts.get(anon_name, 0) + 1
+        self._performer_counts[anon_agent_name] = (
+            self._performer_counts.get(anon_agent_name, 0) + 1
+        )
 
         # Successful agent action — reset skip counter.
         self._consecutive_skips = 0
@@ -574,6 +650,33 @@ class Orchestrator:
         self._log_turn_result(result)
         return result
 
+    # ── Performer call ────────────────────────────────────────────────────────
+
+    async def _call_performer(
+        self, user_prompt: str, agent_name: str, attempt: int,
+    ) -> Optional[str]:
+        """Run one Performer LLM call and log it. Returns the raw output or None."""
+        performer_raw = None
+        try:
+            performer_raw = await self.performer_llm.generate_response(
+                user_prompt, max_retries=1,
+                system_prompt=self._performer_system_prompt,
+            )
+        except Exception as e:
+            self.logger.log_error("performer_llm_call", str(e))
+
+        self.logger.log_llm_call(
+            agent_name=agent_name,
+            system_prompt=self._performer_system_prompt,
+            user_prompt=user_prompt,
+            response=performer_raw,
+            error=None if performer_raw else (
+                f"Performer LLM returned no response "
+                f"(attempt {attempt}/{MAX_PERFORMER_RETRIES})"
+            ),
+        )
+        return performer_raw
+
     # ── Director Update (Call 1) ──────────────────────────────────────────────
 
     async def _director_update(self, anon_recent: List[Message]) -> None:
@@ -609,7 +712,8 @@ class Orchestrator:
 
         self.logger.log_llm_call(
             agent_name="__director_update__",
-            prompt=f"[SYSTEM]\n{self._update_system_prompt}\n\n[USER]\n{update_user}",
+            system_prompt=self._update_system_prompt,
+            user_prompt=update_user,
             response=update_raw,
             error=None if update_raw else "Director Update LLM returned no response",
         )
@@ -666,7 +770,8 @@ class Orchestrator:
 
         self.logger.log_llm_call(
             agent_name="__director_evaluate__",
-            prompt=f"[SYSTEM]\n{self._evaluate_system_prompt}\n\n[USER]\n{evaluate_user}",
+            system_prompt=self._evaluate_system_prompt,
+            user_prompt=evaluate_user,
             response=evaluate_raw,
             error=None if evaluate_raw else "Director Evaluate LLM returned no response",
         )
@@ -727,7 +832,8 @@ class Orchestrator:
 
         self.logger.log_llm_call(
             agent_name="__director_action__",
-            prompt=f"[SYSTEM]\n{self._action_system_prompt}\n\n[USER]\n{action_user}",
+            system_prompt=self._action_system_prompt,
+            user_prompt=action_user,
             response=action_raw,
             error=None if action_raw else "Director Action LLM returned no response",
         )
@@ -11,17 +11,29 @@ The Performer receives:
 It does NOT see the full chat log. The Director has already distilled what
 matters into the instruction and agent profile.
 """
-from pathlib import Path
+from functools import lru_cache
 from typing import List, Optional
 
 from models import Message
 from agents.STAGE.prompts.prompt_renderer import render as _render_prompt
 from agents.STAGE.prompts.prompt_renderer import render_action_type as _render_action_type
+from agents.STAGE.prompts.prompt_renderer import compile_template, fill, load_template, substitute
 
 
 # Load unified Performer prompt template at import time
-_PROMPTS_DIR = Path(__file__).parent / "prompts"
-_RAW_UNIFIED_TEMPLATE = (_PROMPTS_DIR / "performer_prompt.md").read_text(encoding="utf-8")
+_RAW_UNIFIED_TEMPLATE = load_template("performer_prompt.md")
+# The user variant is rebuilt every turn — render its system/user blocks once.
+_USER_TEMPLATE = _render_prompt(_RAW_UNIFIED_TEMPLATE, "user")
+
+# Action types the Performer prompt has blocks for (see _resolve_performer_action_type).
+_PERFORMER_ACTION_TYPES = ("message", "message_targeted", "reply", "@mention")
+
+# Pre-render the action-type blocks for each known type and split out the
+# placeholders, so a turn is a single fill pass.
+_USER_PARTS_BY_ACTION = {
+    action: compile_template(_render_action_type(_USER_TEMPLATE, action))
+    for action in _PERFORMER_ACTION_TYPES
+}
 
 
 def format_recent_messages(messages: List[Message]) -> str:
@@ -52,11 +64,12 @@ def _resolve_performer_action_type(action_type: str, target_user: Optional[str])
     return action_type
 
 
+@lru_cache(maxsize=64)
 def build_performer_system_prompt(chatroom_context: str = "") -> str:
     """Build the Performer system prompt with session-static data only."""
-    prompt = _render_prompt(_RAW_UNIFIED_TEMPLATE, "system")
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    return prompt
+    return substitute(_render_prompt(_RAW_UNIFIED_TEMPLATE, "system"), {
+        "CHATROOM_CONTEXT": chatroom_context,
+    })
 
 
 def build_performer_user_prompt(
@@ -78,15 +91,16 @@ def build_performer_user_prompt(
     target_user_str = target_user or ""
     performer_action = _resolve_performer_action_type(action_type, target_user)
 
-    prompt = _render_prompt(_RAW_UNIFIED_TEMPLATE, "user")
-    prompt = _render_action_type(prompt, performer_action)
-    prompt = prompt.replace("{CHATROOM_CONTEXT}", chatroom_context)
-    prompt = prompt.replace("{AGENT_PROFILE}", profile_str)
-    prompt = prompt.replace("{RECENT_MESSAGES}", recent_str)
-    prompt = prompt.replace("{OBJECTIVE}", objective)
-    prompt = prompt.replace("{MOTIVATION}", motivation)
-    prompt = prompt.replace("{DIRECTIVE}", directive)
-    prompt = prompt.replace("{TARGET_USER}", target_user_str)
-    prompt = prompt.replace("{TARGET_MESSAGE}", target_str)
-
-    return prompt
+    parts = _USER_PARTS_BY_ACTION.get(performer_action)
+    if parts is None:
+        parts = compile_template(_render_action_type(_USER_TEMPLATE, performer_action))
+    return fill(parts, {
+        "CHATROOM_CONTEXT": chatroom_context,
+        "AGENT_PROFILE": profile_str,
+        "RECENT_MESSAGES": recent_str,
+        "OBJECTIVE": objective,
+        "MOTIVATION": motivation,
+        "DIRECTIVE": directive,
+        "TARGET_USER": target_user_str,
+        "TARGET_MESSAGE": target_str,
+    })
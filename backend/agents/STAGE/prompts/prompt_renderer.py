@@ -11,9 +11,18 @@ conditional blocks delimited by:
         action type matches (used in performer prompts)
 
 Content outside any conditional block is included in both variants.
+
+Rendered templates contain ``{PLACEHOLDER}`` fields.  ``substitute`` fills
+them in a single pass.  For templates filled on every turn,
+``compile_template`` splits the text once into literal and placeholder parts
+and ``fill`` joins them with per-call values.
 """
 
 import re
+from pathlib import Path
+from typing import Dict, List
+
+_PROMPTS_DIR = Path(__file__).parent
 
 _BLOCK_RE = re.compile(
     r"\{#(SYSTEM|USER)\}\s*?\n(.*?)\{/\1\}\s*?\n?",
@@ -25,6 +34,15 @@ _ACTION_TYPE_RE = re.compile(
     re.DOTALL,
 )
 
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_PLACEHOLDER_RE = re.compile(r"\{([A-Z_]+)\}")
+
+
+def load_template(filename: str) -> str:
+    """Read a unified prompt template from this directory."""
+    return (_PROMPTS_DIR / filename).read_text(encoding="utf-8")
+
 
 def render(template: str, mode: str) -> str:
     """Render a unified template for the given mode ('system' or 'user').
@@ -47,7 +65,7 @@ def render(template: str, mode: str) -> str:
     result = _BLOCK_RE.sub(_replace, template)
 
     # Collapse excessive blank lines left by stripped blocks
-    result = re.sub(r"\n{3,}", "\n\n", result)
+    result = _EXCESS_BLANK_LINES_RE.sub("\n\n", result)
 
     return result
 
@@ -67,5 +85,41 @@ def render_action_type(template: str, action_type: str) -> str:
         return ""
 
     result = _ACTION_TYPE_RE.sub(_replace, template)
-    result = re.sub(r"\n{3,}", "\n\n", result)
+    result = _EXCESS_BLANK_LINES_RE.sub("\n\n", result)
     return result
+
+
+def substitute(template: str, values: Dict[str, str]) -> str:
+    """Replace ``{PLACEHOLDER}`` fields in *template* in a single pass.
+
+    Placeholders without a value are left in place.
+    """
+    def _replace(m: re.Match) -> str:
+        value = values.get(m.group(1))
+        return value if value is not None else m.group(0)
+
+    return _PLACEHOLDER_RE.sub(_replace, template)
+
+
+def compile_template(template: str) -> List[str]:
+    """Split a rendered template into alternating literal / placeholder parts.
+
+    Even indices are literal text; odd indices are placeholder names
+    (without braces).
+    """
+    return _PLACEHOLDER_RE.split(template)
+
+
+def fill(parts: List[str], values: Dict[str, str]) -> str:
+    """Join compiled template *parts*, substituting placeholder *values*.
+
+    Placeholders without a value are left in place as ``{NAME}``.
+    """
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            value = values.get(part)
+            out.append(value if value is not None else "{" + part + "}")
+        else:
+            out.append(part)
+    return "".join(out)
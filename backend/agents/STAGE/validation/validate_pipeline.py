@@ -231,10 +231,7 @@ async def main():
 
             # Apply the result to state so the next turn sees it
             if result.action_type == "like" and result.target_message_id:
-                target_msg = next(
-                    (m for m in state.messages if m.message_id == result.target_message_id),
-                    None,
-                )
+                target_msg = state.get_message(result.target_message_id)
                 if target_msg:
                     target_msg.toggle_like(result.agent_name)
                     print(f"  [{result.agent_name} liked message {result.target_message_id}]")
@@ -1,9 +1,11 @@
+import asyncio
 from datetime import datetime, timezone
 
 from agents.STAGE.orchestrator import Orchestrator, TurnResult
 from db import connection as db_conn
 from db.repositories import message_repo
 from cache import redis_client
+from cache.redis_client import run_session_op
 
 
 class AgentManager:
@@ -57,20 +59,21 @@ class AgentManager:
         except Exception as exc:
             self.logger.log_error("persist_agent_message", str(exc))
 
-        # Push to Redis context window.
-        try:
-            r = redis_client.get_redis()
-            await redis_client.push_to_window(r, self.session_id, message.to_dict())
-        except Exception as exc:
-            self.logger.log_error("push_agent_message_window", str(exc))
-
-        # Publish via Redis pub/sub — the subscriber loop in SimulationSession
-        # will deliver this to the connected WebSocket.
-        try:
-            r = redis_client.get_redis()
-            await redis_client.publish_event(r, self.session_id, message.to_dict())
-        except Exception as exc:
-            self.logger.log_error("publish_agent_message", str(exc))
+        # Push to the Redis context window and publish via pub/sub concurrently —
+        # the two are independent.  The subscriber loop in SimulationSession
+        # will deliver the published message to the connected WebSocket.
+        # The message is serialised once and the same JSON used for both.
+        payload = redis_client.encode(message.to_dict())
+        await asyncio.gather(
+            run_session_op(
+                self.logger, "push_agent_message_window", redis_client.push_to_window,
+                self.session_id, payload, get_client=redis_client.get_redis,
+            ),
+            run_session_op(
+                self.logger, "publish_agent_message", redis_client.publish_event,
+                self.session_id, payload, get_client=redis_client.get_redis,
+            ),
+        )
 
     async def _handle_like(self, result: TurnResult) -> None:
         """Process an agent 'like' action — update DB and broadcast."""
@@ -79,22 +82,19 @@ class AgentManager:
         if not target_id:
             return
 
-        target_msg = next(
-            (m for m in self.state.messages if m.message_id == target_id),
-            None,
-        )
+        target_msg = self.state.get_message(target_id)
         if not target_msg:
             self.logger.log_error("like_action", f"Target message {target_id} not found")
             return
 
         target_msg.toggle_like(agent_name)
+        # One snapshot of the likers, shared by the DB write and the broadcast.
+        liked_by = list(target_msg.liked_by)
 
         # Persist updated likes to DB.
         try:
             pool = db_conn.get_pool()
-            await message_repo.update_message_likes(
-                pool, target_id, list(target_msg.liked_by)
-            )
+            await message_repo.update_message_likes(pool, target_id, liked_by)
         except Exception as exc:
             self.logger.log_error("persist_like", str(exc))
 
@@ -102,7 +102,7 @@ class AgentManager:
         self.logger.log_event("agent_like", {
             "agent_name": agent_name,
             "message_id": target_id,
-            "likes_count": target_msg.likes_count,
+            "likes_count": len(liked_by),
         })
 
         # Broadcast via Redis pub/sub.
@@ -110,8 +110,8 @@ class AgentManager:
             "event_type": "message_like",
             "message_id": target_id,
             "action": "liked",
-            "likes_count": target_msg.likes_count,
-            "liked_by": list(target_msg.liked_by),
+            "likes_count": len(liked_by),
+            "liked_by": liked_by,
             "user": agent_name,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
@@ -9,11 +9,12 @@ delivery, enabling multi-worker deployments without sticky sessions.
 """
 from __future__ import annotations
 
-import json
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Union
 
 import redis.asyncio as aioredis
 
+from utils import json_codec
+
 _redis: Optional[aioredis.Redis] = None
 
 
@@ -36,6 +37,35 @@ def get_redis() -> aioredis.Redis:
     return _redis
 
 
+def encode(payload: Dict[str, Any]) -> str:
+    """Serialise a dict once so it can be both windowed and published."""
+    return json_codec.dumps(payload)
+
+
+async def run_session_op(
+    logger: Any,
+    label: str,
+    op: Callable[..., Awaitable[Any]],
+    session_id: str,
+    payload: Any,
+    *,
+    get_client: Callable[[], aioredis.Redis] = get_redis,
+) -> bool:
+    """Run a session-scoped helper such as ``publish_event``, logging (not
+    raising) on failure under *label*.
+
+    *get_client* supplies the Redis client; callers pass the ``get_redis``
+    of the module they took *op* from.  Returns True if the operation
+    succeeded.
+    """
+    try:
+        await op(get_client(), session_id, payload)
+        return True
+    except Exception as exc:
+        logger.log_error(label, str(exc))
+        return False
+
+
 # ── Session metadata cache ────────────────────────────────────────────────────
 
 SESSION_TTL = 7200  # 2 h — generous upper bound for session duration
@@ -78,12 +108,16 @@ WINDOW_TTL = SESSION_TTL
 async def push_to_window(
     r: aioredis.Redis,
     session_id: str,
-    message_dict: Dict[str, Any],
+    message_dict: Union[Dict[str, Any], str],
     window: int = 10,
 ) -> None:
-    """Append a message to the rolling context window for LLM prompts."""
+    """Append a message to the rolling context window for LLM prompts.
+
+    Accepts a dict or a string already produced by ``encode()``.
+    """
     key = f"session:{session_id}:window"
-    await r.rpush(key, json.dumps(message_dict))
+    data = message_dict if isinstance(message_dict, str) else encode(message_dict)
+    await r.rpush(key, data)
     await r.ltrim(key, -window, -1)
     await r.expire(key, WINDOW_TTL)
 
@@ -94,7 +128,7 @@ async def get_window(
     """Return the recent-message window as a list of dicts."""
     key = f"session:{session_id}:window"
     items = await r.lrange(key, 0, -1)
-    return [json.loads(item) for item in items]
+    return [json_codec.loads(item) for item in items]
 
 
 # ── Pub/Sub for WebSocket delivery ───────────────────────────────────────────
@@ -104,10 +138,11 @@ def _chan(session_id: str) -> str:
 
 
 async def publish_event(
-    r: aioredis.Redis, session_id: str, event: Dict[str, Any]
+    r: aioredis.Redis, session_id: str, event: Union[Dict[str, Any], str]
 ) -> None:
-    """Publish a serialised event dict to the session channel."""
-    await r.publish(_chan(session_id), json.dumps(event))
+    """Publish an event dict (or a string from ``encode()``) to the session channel."""
+    data = event if isinstance(event, str) else encode(event)
+    await r.publish(_chan(session_id), data)
 
 
 async def subscribe_session(
@@ -129,8 +164,8 @@ async def subscribe_session(
         async for raw in pubsub.listen():
             if raw["type"] == "message":
                 try:
-                    yield json.loads(raw["data"])
-                except (json.JSONDecodeError, TypeError):
+                    yield json_codec.loads(raw["data"])
+                except (json_codec.JSONDecodeError, TypeError):
                     continue
     finally:
         await pubsub.unsubscribe(_chan(session_id))
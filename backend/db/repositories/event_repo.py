@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import asyncpg
 
+_INSERT_EVENT_SQL = """
+    INSERT INTO events(session_id, experiment_id, event_type, data)
+    VALUES($1, $2, $3, $4)
+"""
+
 
 async def insert_event(
     pool: asyncpg.Pool,
@@ -16,17 +21,70 @@ async def insert_event(
     data: Any,
 ) -> None:
     """Append an event row. Swallows exceptions so logging never crashes callers."""
+    try:
+        payload = json.dumps(data)
+    except Exception as exc:
+        # Event logging must never crash the application.
+        import sys
+        print(f"[event_repo] Failed to insert event '{event_type}': {exc}", file=sys.stderr)
+        return
+    await _insert_serialised(pool, session_id, experiment_id, event_type, payload)
+
+
+async def insert_events(
+    pool: asyncpg.Pool,
+    *,
+    session_id: Optional[str] = None,
+    experiment_id: str,
+    events: Sequence[Tuple[str, Any]],
+) -> None:
+    """Append several (event_type, data) rows in one round trip, in order.
+
+    Each row is serialised on its own, and if the batch insert fails the rows
+    are retried one by one, so a single bad event cannot take the rest of the
+    batch with it.  Swallows exceptions so logging never crashes callers.
+    """
+    import sys
+    rows = []
+    for event_type, data in events:
+        try:
+            rows.append((session_id, experiment_id, event_type, json.dumps(data)))
+        except Exception as exc:
+            print(
+                f"[event_repo] Failed to serialise event '{event_type}': {exc}",
+                file=sys.stderr,
+            )
+    if not rows:
+        return
+    try:
+        async with pool.acquire() as conn:
+            await conn.executemany(_INSERT_EVENT_SQL, rows)
+        return
+    except Exception as exc:
+        print(
+            f"[event_repo] Batch insert of {len(rows)} events failed, retrying one by one: {exc}",
+            file=sys.stderr,
+        )
+    for _, _, event_type, payload in rows:
+        await _insert_serialised(pool, session_id, experiment_id, event_type, payload)
+
+
+async def _insert_serialised(
+    pool: asyncpg.Pool,
+    session_id: Optional[str],
+    experiment_id: str,
+    event_type: str,
+    payload: str,
+) -> None:
+    """Insert one already-serialised event row, swallowing failures."""
     try:
         async with pool.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO events(session_id, experiment_id, event_type, data)
-                VALUES($1, $2, $3, $4)
-                """,
+                _INSERT_EVENT_SQL,
                 session_id,
                 experiment_id,
                 event_type,
-                json.dumps(data),
+                payload,
             )
     except Exception as exc:
         # Event logging must never crash the application.
@@ -47,7 +105,7 @@ async def get_session_events(
                 SELECT id, event_type, occurred_at, data
                 FROM   events
                 WHERE  session_id = $1 AND event_type = ANY($2)
-                ORDER  BY occurred_at
+                ORDER  BY occurred_at, id
                 """,
                 session_id,
                 event_types,
@@ -58,7 +116,7 @@ async def get_session_events(
                 SELECT id, event_type, occurred_at, data
                 FROM   events
                 WHERE  session_id = $1
-                ORDER  BY occurred_at
+                ORDER  BY occurred_at, id
                 """,
                 session_id,
             )
@@ -18,7 +18,7 @@ class GateUntilUserPost(BaseFeature):
         self._gate_opened = False
 
     def agents_active(self, state: SessionState) -> bool:
-        active = any(m.sender == state.user_name for m in state.messages)
+        active = state.last_message_from(state.user_name) is not None
         if active and not self._gate_opened:
             self._gate_opened = True
             if self.logger:
@@ -19,7 +19,7 @@ load_dotenv()
 
 from platforms import SimulationSession
 from utils.session_manager import session_manager
-from utils import token_manager
+from utils import json_codec, token_manager
 from utils.logger import Logger
 from utils.log_viewer import generate_html_from_lines
 from db import connection as db_conn
@@ -254,7 +254,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket.accept()
 
     async def send_to_frontend(message_dict: dict):
-        await websocket.send_json(message_dict)
+        await websocket.send_text(json_codec.dumps(message_dict))
 
     # Existing session check — handles reconnects (same worker).
     session = await session_manager.get_or_reconstruct(session_id, send_to_frontend)
@@ -304,7 +304,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     # Session has ended — close the WebSocket cleanly.
                     await websocket.close(code=1000, reason="session_ended")
                     return
-                await websocket.send_json({"type": "ping"})
+                await websocket.send_text(json_codec.dumps({"type": "ping"}))
         except Exception:
             pass  # connection closed — the main loop handles cleanup
 
@@ -312,7 +312,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = json_codec.loads(await websocket.receive_text())
             if data.get("type") == "pong":
                 continue  # heartbeat response, ignore
             if data.get("type") == "user_message":
@@ -348,17 +348,19 @@ async def like_message(session_id: str, message_id: str, payload: LikeRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    message = next((m for m in session.state.messages if m.message_id == message_id), None)
+    message = session.state.get_message(message_id)
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
 
     user_id = payload.user
     result = message.toggle_like(user_id)
+    # One snapshot of the likers, shared by the DB write and the broadcast.
+    liked_by = list(message.liked_by)
 
     # Persist likes update to DB.
     try:
         pool = _get_pool()
-        await message_repo.update_message_likes(pool, message_id, list(message.liked_by))
+        await message_repo.update_message_likes(pool, message_id, liked_by)
     except Exception as exc:
         session.logger.log_error("persist_like", str(exc))
 
@@ -367,7 +369,7 @@ async def like_message(session_id: str, message_id: str, payload: LikeRequest):
         "message_id": message_id,
         "user": user_id,
         "action": result,
-        "likes_count": message.likes_count,
+        "likes_count": len(liked_by),
     })
 
     # Broadcast via Redis pub/sub.
@@ -376,8 +378,8 @@ async def like_message(session_id: str, message_id: str, payload: LikeRequest):
         "session_id": session_id,
         "message_id": message_id,
         "action": result,
-        "likes_count": message.likes_count,
-        "liked_by": list(message.liked_by),
+        "likes_count": len(liked_by),
+        "liked_by": liked_by,
         "user": user_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
@@ -397,12 +399,15 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    message = next((m for m in session.state.messages if m.message_id == message_id), None)
+    message = session.state.get_message(message_id)
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
 
     user_id = payload.user
     result = message.toggle_report()
+    # One timestamp for the block record and every event this report emits.
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     # Persist reported flag.
     try:
@@ -414,8 +419,7 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
     blocked = None
     target_sender = message.sender
     if payload.block and target_sender and target_sender != session.state.user_name:
-        when_iso = datetime.now(timezone.utc).isoformat()
-        session.state.block_agent(target_sender, when_iso)
+        session.state.block_agent(target_sender, now_iso)
 
         # Persist block to DB.
         try:
@@ -424,7 +428,7 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
                 pool,
                 session_id=session_id,
                 agent_name=target_sender,
-                blocked_at=datetime.now(timezone.utc),
+                blocked_at=now,
                 blocked_by=user_id,
             )
         except Exception as exc:
@@ -432,7 +436,7 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
 
         session.logger.log_event("user_block", {
             "agent_name": target_sender,
-            "blocked_at": when_iso,
+            "blocked_at": now_iso,
             "by": user_id,
         })
         blocked = dict(session.state.blocked_agents)
@@ -455,7 +459,7 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
             "action": result,
             "user": user_id,
             "reported": message.reported,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso,
         })
         if blocked is not None:
             await redis_client.publish_event(r, session_id, {
@@ -463,7 +467,7 @@ async def report_message(session_id: str, message_id: str, payload: ReportReques
                 "session_id": session_id,
                 "user": user_id,
                 "blocked": blocked,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": now_iso,
             })
     except Exception as exc:
         session.logger.log_error("publish_report", str(exc))
@@ -5,7 +5,7 @@ from typing import Optional, List, Set
 
 
 # Represents a single message or post. 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a single message in the chatroom."""
     
@@ -6,7 +6,7 @@ from models.message import Message
 
 # Represents the state of a simulation session.
 # NOTE: concurrent sessions handled via utils/session_manager.py
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Holds the complete state of a simulation session."""
     
@@ -24,10 +24,49 @@ class SessionState:
     # This allows keeping existing messages visible while suppressing new ones
     # created after the block time.
     blocked_agents: Dict[str, str] = field(default_factory=dict)
+    # Name -> Agent lookup, built once from the (fixed) agent roster.
+    _agents_by_name: Dict[str, Agent] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    # message_id -> Message, maintained by add_message().
+    _messages_by_id: Dict[str, Message] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    # Sender -> that sender's messages in posting order, maintained by add_message().
+    _messages_by_sender: Dict[str, List[Message]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._agents_by_name = {a.name: a for a in self.agents}
+        for m in self.messages:
+            self._messages_by_id[m.message_id] = m
+            self._messages_by_sender.setdefault(m.sender, []).append(m)
+
+    def get_agent(self, name: str) -> Optional[Agent]:
+        """Return the agent with the given name, or None if not in this session."""
+        return self._agents_by_name.get(name)
  
     def add_message(self, message: Message) -> None:
         """Add a message to the session history."""
         self.messages.append(message)
+        self._messages_by_id[message.message_id] = message
+        self._messages_by_sender.setdefault(message.sender, []).append(message)
+
+    def get_message(self, message_id: str) -> Optional[Message]:
+        """Return the message with the given id, or None if unknown."""
+        return self._messages_by_id.get(message_id)
+
+    def last_message_from(self, sender: str) -> Optional[Message]:
+        """Return the most recent message posted by *sender*, or None."""
+        sent = self._messages_by_sender.get(sender)
+        return sent[-1] if sent else None
+
+    def recent_messages_from(self, sender: str, n: int) -> List[Message]:
+        """Return the last *n* messages posted by *sender*, oldest first."""
+        if n <= 0:
+            return []
+        return self._messages_by_sender.get(sender, [])[-n:]
     
     def get_recent_messages(self, n: int) -> List[Message]:
         """Get the last n messages from the history."""
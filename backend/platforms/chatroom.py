@@ -12,6 +12,14 @@ from features import load_features
 from db import connection as db_conn
 from db.repositories import session_repo, message_repo
 from cache import redis_client
+from cache.redis_client import run_session_op
+
+# Keys of a persisted message dict that map to Message fields; anything
+# else is carried over as metadata on reconstruction.
+_MESSAGE_FIELDS = frozenset({
+    "sender", "content", "timestamp", "message_id", "reply_to", "quoted_text",
+    "mentions", "liked_by", "reported", "likes_count",
+})
 
 
 class SimulationSession:
@@ -96,7 +104,7 @@ class SimulationSession:
         # Preload persisted messages into in-memory state (crash recovery / reconstruction).
         if _preloaded_messages:
             for m in _preloaded_messages:
-                self.state.messages.append(Message(
+                self.state.add_message(Message(
                     sender=m["sender"],
                     content=m["content"],
                     timestamp=datetime.fromisoformat(m["timestamp"]),
@@ -107,10 +115,7 @@ class SimulationSession:
                     liked_by=set(m.get("liked_by", [])),
                     reported=m.get("reported", False),
                     metadata={k: v for k, v in m.items()
-                               if k not in ("sender", "content", "timestamp",
-                                            "message_id", "reply_to", "quoted_text",
-                                            "mentions", "liked_by", "reported",
-                                            "likes_count")},
+                               if k not in _MESSAGE_FIELDS},
                 ))
 
         # Preload agent blocks (crash recovery / reconstruction).
@@ -270,6 +275,7 @@ class SimulationSession:
 
     # Typing speed for realistic delay: ~8.3 chars/sec ≈ 100 WPM fast typer.
     TYPING_CHARS_PER_SECOND = 8.3
+    TYPING_SECONDS_PER_CHAR = 1.0 / TYPING_CHARS_PER_SECOND
     TYPING_DELAY_MIN = 0.5   # minimum delay even for very short messages
     TYPING_DELAY_MAX = 6.0   # cap so long messages don't stall too long
 
@@ -293,7 +299,7 @@ class SimulationSession:
 
                 # Apply realistic typing delay based on message length.
                 if result.message and result.message.content:
-                    delay = len(result.message.content) / self.TYPING_CHARS_PER_SECOND
+                    delay = len(result.message.content) * self.TYPING_SECONDS_PER_CHAR
                     delay = max(self.TYPING_DELAY_MIN, min(delay, self.TYPING_DELAY_MAX))
                     await asyncio.sleep(delay)
 
@@ -371,22 +377,26 @@ class SimulationSession:
         except Exception as exc:
             self.logger.log_error("persist_user_message", str(exc))
 
-        # Push to Redis context window.
-        try:
-            r = redis_client.get_redis()
-            await redis_client.push_to_window(r, self.session_id, message.to_dict())
-        except Exception as exc:
-            self.logger.log_error("push_user_message_window", str(exc))
+        # Push to the Redis context window and publish via Redis (so the
+        # pub/sub loop delivers it to the WebSocket) concurrently; the two
+        # writes are independent.  Serialize the message only once.
+        payload = message.to_dict()
+        encoded = redis_client.encode(payload)
+        _, published = await asyncio.gather(
+            run_session_op(
+                self.logger, "push_user_message_window", redis_client.push_to_window,
+                self.session_id, encoded, get_client=redis_client.get_redis,
+            ),
+            run_session_op(
+                self.logger, "publish_user_message", redis_client.publish_event,
+                self.session_id, encoded, get_client=redis_client.get_redis,
+            ),
+        )
 
-        # Publish via Redis so the pub/sub loop delivers it to the WebSocket.
-        try:
-            r = redis_client.get_redis()
-            await redis_client.publish_event(r, self.session_id, message.to_dict())
-        except Exception as exc:
-            self.logger.log_error("publish_user_message", str(exc))
+        if not published:
             # Fall back to direct send if Redis publish fails.
             try:
-                await self.websocket_send(message.to_dict())
+                await self.websocket_send(payload)
             except Exception as send_exc:
                 self.logger.log_error("fallback_send_user_message", str(send_exc))
 
@@ -396,7 +406,10 @@ class SimulationSession:
         """Attach (or re-attach) a WebSocket and replay missed messages.
 
         Messages are replayed from the DB so reconnects to a different worker
-        (or after a crash) get the full history.
+        (or after a crash) get the full history.  The visible history goes out
+        as one batch frame; if that send fails the socket is gone, nothing is
+        replayed (logged as replayed_messages=0), and the client's reconnect
+        replays it again.
         """
         self._raw_ws_send = websocket_send
         self.websocket_send = self._wrap_send(websocket_send)
@@ -409,18 +422,15 @@ class SimulationSession:
             except asyncio.CancelledError:
                 pass
 
-        # Replay messages from DB (covers cross-worker reconnect).
+        # Replay messages from DB (covers cross-worker reconnect).  History is
+        # sent as a single batch frame rather than one frame per message.
         try:
             pool = db_conn.get_pool()
             past_messages = await message_repo.get_session_messages(pool, self.session_id)
-            replayed = 0
-            for m in past_messages:
-                try:
-                    await self.websocket_send(m)
-                    replayed += 1
-                except Exception as exc:
-                    self.logger.log_error("replay_single_message", str(exc))
-                    continue
+            visible = [m for m in past_messages if not self._is_suppressed(m)]
+            if visible:
+                await websocket_send({"type": "batch", "messages": visible})
+            replayed = len(visible)
         except Exception as exc:
             self.logger.log_error("replay_messages", str(exc))
             replayed = 0
@@ -467,21 +477,29 @@ class SimulationSession:
     async def _noop_send(self, message: dict) -> None:
         return
 
+    def _is_suppressed(self, message_dict: dict) -> bool:
+        """Return True if the message is from a blocked sender, sent after the block."""
+        sender = message_dict.get("sender")
+        if sender and sender in self.state.blocked_agents:
+            blocked_iso = self.state.blocked_agents.get(sender)
+            if blocked_iso:
+                try:
+                    msg_time = datetime.fromisoformat(message_dict.get("timestamp", ""))
+                    blocked_time = datetime.fromisoformat(blocked_iso)
+                    return msg_time >= blocked_time
+                except ValueError:
+                    # Malformed timestamp — allow the send rather than silently dropping.
+                    self.logger.log_error(
+                        "block_timestamp_parse",
+                        f"Could not compare timestamps for sender '{sender}'",
+                    )
+        return False
+
     def _wrap_send(self, send_callable: Callable) -> Callable:
         """Return an async wrapper that checks blocked_agents before sending."""
         async def wrapper(message_dict: dict):
-            sender = message_dict.get("sender")
-            if sender and sender in self.state.blocked_agents:
-                blocked_iso = self.state.blocked_agents.get(sender)
-                if blocked_iso:
-                    try:
-                        msg_time = datetime.fromisoformat(message_dict.get("timestamp", ""))
-                        blocked_time = datetime.fromisoformat(blocked_iso)
-                        if msg_time >= blocked_time:
-                            return
-                    except ValueError:
-                        # Malformed timestamp — allow the send rather than silently dropping.
-                        self.logger.log_error("block_timestamp_parse", f"Could not compare timestamps for sender '{sender}'")
+            if self._is_suppressed(message_dict):
+                return
             try:
                 await send_callable(message_dict)
             except Exception as exc:
@@ -207,6 +207,28 @@ class TestHandleMessage:
 
             am.logger.log_error.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_window_failure_does_not_block_publish(self):
+        am = _make_agent_manager()
+        msg = Message.create(sender="Alice", content="Hello")
+        result = TurnResult(action_type="message", agent_name="Alice", message=msg)
+
+        with patch("agents.agent_manager.db_conn") as mock_db, \
+             patch("agents.agent_manager.redis_client") as mock_redis, \
+             patch("agents.agent_manager.message_repo") as mock_msg_repo:
+            mock_db.get_pool.return_value = MagicMock()
+            mock_msg_repo.insert_message = AsyncMock()
+            mock_redis.get_redis.return_value = MagicMock()
+            mock_redis.push_to_window = AsyncMock(side_effect=RuntimeError("Redis down"))
+            mock_redis.publish_event = AsyncMock()
+
+            await am._handle_message(result)
+
+            mock_redis.publish_event.assert_called_once()
+            am.logger.log_error.assert_called_once_with(
+                "push_agent_message_window", "Redis down",
+            )
+
 
 # ── _handle_like ─────────────────────────────────────────────────────────────
 
@@ -290,6 +312,37 @@ class TestHandleLike:
             assert event["event_type"] == "message_like"
             assert event["message_id"] == msg.message_id
 
+    @pytest.mark.asyncio
+    async def test_like_landing_during_db_write_keeps_event_consistent(self):
+        """likes_count must describe the same snapshot as liked_by."""
+        state = _make_state()
+        msg = Message.create(sender="Bob", content="Great point")
+        state.add_message(msg)
+
+        am = _make_agent_manager(state)
+        result = TurnResult(
+            action_type="like",
+            agent_name="Alice",
+            target_message_id=msg.message_id,
+        )
+
+        async def concurrent_like(*args):
+            msg.toggle_like("participant")
+
+        with patch("agents.agent_manager.db_conn") as mock_db, \
+             patch("agents.agent_manager.redis_client") as mock_redis, \
+             patch("agents.agent_manager.message_repo") as mock_msg_repo:
+            mock_db.get_pool.return_value = MagicMock()
+            mock_msg_repo.update_message_likes = AsyncMock(side_effect=concurrent_like)
+            mock_redis.get_redis.return_value = MagicMock()
+            mock_redis.publish_event = AsyncMock()
+
+            await am._handle_like(result)
+
+            event = mock_redis.publish_event.call_args[0][2]
+            assert event["liked_by"] == ["Alice"]
+            assert event["likes_count"] == 1
+
     @pytest.mark.asyncio
     async def test_no_target_id_is_noop(self):
         am = _make_agent_manager()
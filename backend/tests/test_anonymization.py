@@ -12,6 +12,7 @@ from agents.STAGE.orchestrator import (
     anonymize_agents,
     deanonymize_text,
     _replace_names_in_text,
+    _name_pattern,
 )
 
 
@@ -149,3 +150,19 @@ class TestReplaceNames:
 
     def test_none_text(self):
         assert _replace_names_in_text(None, {"A": "B"}) is None
+
+    def test_precomputed_pattern_matches_default(self):
+        nm = {"Performer 1": "A", "Performer 10": "B"}
+        pattern = _name_pattern(nm)
+        text = "Performer 10 and Performer 1"
+        assert _replace_names_in_text(text, nm, pattern) == _replace_names_in_text(text, nm)
+        assert _replace_names_in_text(text, nm) == "B and A"
+
+    def test_replacements_are_not_rewritten(self):
+        """A label inserted for one name is not matched again by a later name."""
+        nm = {"Alice": "Bob", "Bob": "Carol"}
+        assert _replace_names_in_text("Alice and Bob", nm) == "Bob and Carol"
+
+    def test_regex_metacharacters_in_names(self):
+        nm = {"a.b": "Performer 1"}
+        assert _replace_names_in_text("axb a.b", nm) == "axb Performer 1"
@@ -6,6 +6,7 @@ Covers:
 - Clock loop tick-based pacing
 - User message handling
 - Blocked agent filtering (_wrap_send)
+- WebSocket attach (batched history replay)
 - Preloaded messages (crash recovery)
 - Feature integration (seed, agents_active gating)
 - Typing indicator publishing
@@ -29,6 +30,8 @@ MINIMAL_SIM_CONFIG = {
     "session_duration_minutes": 30,
     "messages_per_minute": 6,
     "evaluate_interval": 10,
+    "action_window_size": 10,
+    "performer_memory_size": 3,
     "random_seed": 42,
     "llm_provider": "gemini",
 }
@@ -115,6 +118,13 @@ def _create_session(treatment_group="control", config=None, **kwargs):
     return session, ws
 
 
+def _create_running_session(**kwargs):
+    """Create a session as it is after start(): running, so it accepts user messages."""
+    session, ws = _create_session(**kwargs)
+    session.running = True
+    return session, ws
+
+
 # ── Construction ─────────────────────────────────────────────────────────────
 
 class TestSimulationSessionInit:
@@ -332,7 +342,7 @@ class TestHandleUserMessage:
     @pytest.mark.asyncio
     async def test_adds_to_state(self):
         with _patch_externals() as mocks:
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             await session.handle_user_message("Hello!")
             assert len(session.state.messages) == 1
             assert session.state.messages[0].sender == "participant"
@@ -341,28 +351,28 @@ class TestHandleUserMessage:
     @pytest.mark.asyncio
     async def test_persists_to_db(self):
         with _patch_externals() as mocks:
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             await session.handle_user_message("Hello!")
             mocks["message_repo"].insert_message.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_publishes_via_redis(self):
         with _patch_externals() as mocks:
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             await session.handle_user_message("Hello!")
             mocks["redis"].publish_event.assert_called()
 
     @pytest.mark.asyncio
     async def test_pushes_to_redis_window(self):
         with _patch_externals() as mocks:
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             await session.handle_user_message("Hello!")
             mocks["redis"].push_to_window.assert_called()
 
     @pytest.mark.asyncio
     async def test_reply_metadata(self):
         with _patch_externals() as mocks:
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             await session.handle_user_message(
                 "I agree",
                 reply_to="msg-1",
@@ -381,7 +391,7 @@ class TestHandleUserMessage:
             mocks["message_repo"].insert_message = AsyncMock(
                 side_effect=RuntimeError("DB down")
             )
-            session, _ = _create_session()
+            session, _ = _create_running_session()
             # Should not raise
             await session.handle_user_message("Hello!")
             # Message still added to state
@@ -394,9 +404,23 @@ class TestHandleUserMessage:
             mocks["redis"].publish_event = AsyncMock(
                 side_effect=RuntimeError("Redis down")
             )
-            session, ws = _create_session()
+            session, ws = _create_running_session()
             await session.handle_user_message("Hello!")
             # The wrapped websocket_send should have been called as fallback
+            ws.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_window_push_error_does_not_block_publish(self):
+        with _patch_externals() as mocks:
+            mocks["redis"].push_to_window = AsyncMock(
+                side_effect=RuntimeError("Redis down")
+            )
+            session, _ = _create_running_session()
+            session.logger = MagicMock()
+            await session.handle_user_message("Hello!")
+            mocks["redis"].publish_event.assert_called_once()
+            session.logger.log_error.assert_called_once()
+            assert session.logger.log_error.call_args[0][0] == "push_user_message_window"
 
 
 # ── Blocked agent filtering ─────────────────────────────────────────────────
@@ -513,6 +537,67 @@ class TestFeatureIntegration:
             assert len(session.features._features) == 0
 
 
+# ── Attach WebSocket (history replay) ────────────────────────────────────────
+
+async def _attach(session, history, send):
+    session.logger = MagicMock()
+    with patch("platforms.chatroom.message_repo") as mock_message_repo, \
+         patch("platforms.chatroom.db_conn"):
+        mock_message_repo.get_session_messages = AsyncMock(return_value=history)
+        await session.attach_websocket(send)
+    session._subscriber_task.cancel()
+
+
+class TestAttachWebSocket:
+
+    @pytest.mark.asyncio
+    async def test_replays_history_as_one_batch_frame(self):
+        with _patch_externals():
+            session, _ = _create_session()
+            block_time = datetime.now(timezone.utc)
+            session.state.block_agent("Alice", block_time.isoformat())
+            history = [
+                {"sender": "Bob", "content": "one",
+                 "timestamp": (block_time - timedelta(seconds=5)).isoformat()},
+                {"sender": "Alice", "content": "before block",
+                 "timestamp": (block_time - timedelta(seconds=1)).isoformat()},
+                {"sender": "Alice", "content": "after block",
+                 "timestamp": (block_time + timedelta(seconds=1)).isoformat()},
+            ]
+            send = AsyncMock()
+            await _attach(session, history, send)
+
+            send.assert_awaited_once()
+            frame = send.await_args.args[0]
+            assert frame["type"] == "batch"
+            assert [m["content"] for m in frame["messages"]] == ["one", "before block"]
+            session.logger.log_event.assert_called_with(
+                "websocket_attach", {"replayed_messages": 2}
+            )
+
+    @pytest.mark.asyncio
+    async def test_empty_history_sends_nothing(self):
+        with _patch_externals():
+            session, _ = _create_session()
+            send = AsyncMock()
+            await _attach(session, [], send)
+            send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_replay_send_is_logged(self):
+        with _patch_externals():
+            session, _ = _create_session()
+            history = [{"sender": "Bob", "content": "one",
+                        "timestamp": datetime.now(timezone.utc).isoformat()}]
+            send = AsyncMock(side_effect=RuntimeError("socket closed"))
+            await _attach(session, history, send)
+
+            session.logger.log_error.assert_called_once_with("replay_messages", "socket closed")
+            session.logger.log_event.assert_called_with(
+                "websocket_attach", {"replayed_messages": 0}
+            )
+
+
 # ── Detach WebSocket ─────────────────────────────────────────────────────────
 
 class TestDetachWebSocket:
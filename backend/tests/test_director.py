@@ -118,6 +118,11 @@ class TestParseUpdateResponseValid:
         data = parse_update_response(raw)
         assert data["performer_profile_update"] == "neutral"
 
+    def test_plain_json_with_trailing_text(self):
+        raw = '{"performer_profile_update": "quiet"}\n\nLet me know if you need more.'
+        data = parse_update_response(raw)
+        assert data["performer_profile_update"] == "quiet"
+
 
 # ── parse_update_response — invalid inputs ───────────────────────────────────
 
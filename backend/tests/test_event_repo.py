@@ -5,6 +5,9 @@ Skips gracefully when PostgreSQL is unavailable.
 """
 
 import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 import pytest_asyncio
 
@@ -77,6 +80,36 @@ class TestInsertEvent:
         multi = [e for e in events if e["event_type"].startswith("multi_event_")]
         assert len(multi) >= 3
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_insert_events_batch_preserves_order(self, db_pool, seed_session):
+        await event_repo.insert_events(
+            db_pool,
+            session_id="evt_test_session",
+            experiment_id="evt_test_exp",
+            events=[(f"batch_event_{i}", {"index": i}) for i in range(3)],
+        )
+        events = await event_repo.get_session_events(db_pool, "evt_test_session")
+        batch = [e for e in events if e["event_type"].startswith("batch_event_")]
+        assert [e["data"]["index"] for e in batch[-3:]] == [0, 1, 2]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_insert_events_bad_row_does_not_drop_batch(self, db_pool, seed_session):
+        """A row JSONB rejects (NUL escape) must not lose the rows around it."""
+        await event_repo.insert_events(
+            db_pool,
+            session_id="evt_test_session",
+            experiment_id="evt_test_exp",
+            events=[
+                ("poison_ok_1", {"index": 1}),
+                ("poison_bad", {"text": "nul \u0000 byte"}),
+                ("poison_ok_2", {"index": 2}),
+            ],
+        )
+        events = await event_repo.get_session_events(db_pool, "evt_test_session")
+        types = [e["event_type"] for e in events]
+        assert "poison_ok_1" in types and "poison_ok_2" in types
+        assert "poison_bad" not in types
+
     @pytest.mark.asyncio(loop_scope="session")
     async def test_insert_swallows_exceptions(self, db_pool, seed_session):
         """insert_event should never raise, even with bad data."""
@@ -92,6 +125,66 @@ class TestInsertEvent:
         # If we get here, the exception was swallowed
 
 
+# ── insert_events fallback (no database needed) ────────────────────────────
+
+def _mock_pool(conn):
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    return pool
+
+
+class TestInsertEventsFallback:
+
+    async def test_unserialisable_row_is_skipped(self):
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        await event_repo.insert_events(
+            _mock_pool(conn),
+            session_id="s",
+            experiment_id="e",
+            events=[("ok", {"a": 1}), ("bad", {"obj": object()}), ("ok2", {"b": 2})],
+        )
+        rows = conn.executemany.await_args.args[1]
+        assert [r[2] for r in rows] == ["ok", "ok2"]
+
+    async def test_failed_batch_retries_rows_individually(self):
+        conn = MagicMock()
+        conn.executemany = AsyncMock(side_effect=Exception("invalid input"))
+        conn.execute = AsyncMock(side_effect=[None, Exception("invalid input"), None])
+        await event_repo.insert_events(
+            _mock_pool(conn),
+            session_id="s",
+            experiment_id="e",
+            events=[("one", 1), ("two", 2), ("three", 3)],
+        )
+        assert [c.args[3] for c in conn.execute.await_args_list] == ["one", "two", "three"]
+
+
+    async def test_insert_event_uses_shared_insert(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        await event_repo.insert_event(
+            _mock_pool(conn), session_id="s", experiment_id="e",
+            event_type="one", data={"a": 1},
+        )
+        assert conn.execute.await_args.args == (
+            event_repo._INSERT_EVENT_SQL, "s", "e", "one", '{"a": 1}',
+        )
+
+    async def test_insert_event_unserialisable_data_is_dropped(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        await event_repo.insert_event(
+            _mock_pool(conn), session_id="s", experiment_id="e",
+            event_type="bad", data={"obj": object()},
+        )
+        conn.execute.assert_not_called()
+
+
 # ── get_session_events ───────────────────────────────────────────────────────
 
 class TestGetSessionEvents:
@@ -0,0 +1,34 @@
+"""Tests for utils/json_codec.py (orjson when installed, stdlib otherwise)."""
+import importlib
+import json
+import sys
+
+import pytest
+
+from utils import json_codec
+
+
+def test_round_trip():
+    payload = {"sender": "Alice", "content": "héllo 👋", "mentions": ["Bob"], "likes_count": 2}
+    encoded = json_codec.dumps(payload)
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == payload
+    assert json_codec.loads(encoded) == payload
+
+
+def test_malformed_input_raises_decode_error():
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads("{not json")
+
+
+def test_stdlib_fallback(monkeypatch):
+    """Without orjson the codec still produces equivalent JSON."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback = importlib.reload(json_codec)
+    try:
+        assert fallback.orjson is None
+        assert json.loads(fallback.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+        assert fallback.loads('{"a": 1}') == {"a": 1}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(json_codec)
@@ -7,7 +7,7 @@ import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from utils.llm.llm_manager import LLMManager, _create_client
+from utils.llm.llm_manager import LLMManager, _client_cache, _create_client
 
 
 # ── Construction / validation ────────────────────────────────────────────────
@@ -118,6 +118,47 @@ class TestFromSimulationConfig:
             mgr = LLMManager.from_simulation_config(config, role="performer")
             mock_create.assert_called_once_with(config)
 
+    def test_clients_shared_across_sessions(self):
+        """Identical settings reuse one client; different settings get their own."""
+        config = {"llm_provider": "mistral", "llm_model": "m-shared", "temperature": 0.7}
+        with patch.dict(_client_cache, clear=True), \
+             patch("utils.llm.llm_manager._create_client") as mock_create:
+            mock_create.side_effect = lambda *a, **k: MagicMock()
+            first = LLMManager.from_simulation_config(config)
+            second = LLMManager.from_simulation_config(dict(config))
+            other = LLMManager.from_simulation_config({**config, "temperature": 0.2})
+            assert first.client is second.client
+            assert other.client is not first.client
+            assert mock_create.call_count == 2
+
+    def test_sessions_with_different_configs_get_separate_clients(self):
+        """Sessions differing in provider or model never share a client."""
+        with patch.dict(_client_cache, clear=True), \
+             patch("utils.llm.llm_manager._create_client") as mock_create:
+            mock_create.side_effect = lambda *a, **k: MagicMock()
+            session_a = LLMManager.from_simulation_config(
+                {"llm_provider": "mistral", "llm_model": "m-a"}
+            )
+            session_b = LLMManager.from_simulation_config(
+                {"llm_provider": "mistral", "llm_model": "m-b"}
+            )
+            session_c = LLMManager.from_simulation_config(
+                {"llm_provider": "anthropic", "llm_model": "m-a"}
+            )
+            clients = {id(session_a.client), id(session_b.client), id(session_c.client)}
+            assert len(clients) == 3
+
+    def test_on_device_client_not_shared(self):
+        """The on-device provider gets its own client per session and is never cached."""
+        config = {"llm_provider": "none"}
+        with patch.dict(_client_cache, clear=True), \
+             patch("utils.llm.llm_manager._create_client") as mock_create:
+            mock_create.side_effect = lambda *a, **k: MagicMock()
+            first = LLMManager.from_simulation_config(config)
+            second = LLMManager.from_simulation_config(config)
+            assert first.client is not second.client
+            assert _client_cache == {}
+
     def test_no_role_uses_generic(self):
         config = {
             "llm_provider": "gemini",
@@ -102,6 +102,18 @@ class TestLogMethods:
             assert data["response"] == "response text"
             assert data["error"] is None
 
+    @pytest.mark.asyncio
+    async def test_log_llm_call_joins_prompt_parts(self):
+        logger = Logger("s1", "e1")
+
+        with patch.object(logger, "_async_insert", new_callable=AsyncMock) as mock_insert:
+            logger.log_llm_call(
+                "Alice", response="ok", system_prompt="sys", user_prompt="usr",
+            )
+            await asyncio.sleep(0.01)
+            data = mock_insert.call_args[0][1]
+            assert data["prompt"] == "[SYSTEM]\nsys\n\n[USER]\nusr"
+
     @pytest.mark.asyncio
     async def test_log_error_schedules_and_writes_fallback(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
@@ -123,6 +135,19 @@ class TestLogMethods:
         assert line["session_id"] == "s1"
 
 
+    @pytest.mark.asyncio
+    async def test_same_tick_events_written_as_one_batch(self):
+        logger = Logger("s1", "e1")
+
+        with patch.object(logger, "_async_insert", new_callable=AsyncMock) as mock_insert, \
+             patch.object(logger, "_async_insert_many", new_callable=AsyncMock) as mock_many:
+            logger.log_event("evt1", {"n": 1})
+            logger.log_event("evt2", {"n": 2})
+            await asyncio.sleep(0.01)
+            mock_insert.assert_not_called()
+            mock_many.assert_called_once_with([("evt1", {"n": 1}), ("evt2", {"n": 2})])
+
+
 # ── drain() ──────────────────────────────────────────────────────────────────
 
 class TestDrain:
@@ -133,17 +158,35 @@ class TestDrain:
 
         completed = []
 
-        async def slow_insert(event_type, data):
+        async def slow_insert_many(events):
             await asyncio.sleep(0.05)
+            completed.extend(event_type for event_type, _ in events)
+
+        with patch.object(logger, "_async_insert_many", side_effect=slow_insert_many):
+            logger.log_event("evt1", {})
+            logger.log_event("evt2", {})
+            assert len(completed) == 0
+
+            await logger.drain()
+            assert completed == ["evt1", "evt2"]
+
+    @pytest.mark.asyncio
+    async def test_drain_includes_events_logged_during_flush(self):
+        logger = Logger("s1", "e1")
+
+        completed = []
+
+        async def slow_insert(event_type, data):
+            await asyncio.sleep(0.02)
             completed.append(event_type)
 
         with patch.object(logger, "_async_insert", side_effect=slow_insert):
             logger.log_event("evt1", {})
+            await asyncio.sleep(0.01)  # first flush is now in flight
             logger.log_event("evt2", {})
-            assert len(completed) == 0
 
             await logger.drain()
-            assert len(completed) == 2
+            assert completed == ["evt1", "evt2"]
 
     @pytest.mark.asyncio
     async def test_drain_empty(self):
@@ -6,6 +6,7 @@ focus on execute_turn() flow, the three-call Director, agent profile accumulatio
 retry logic, and action routing.
 """
 
+import asyncio
 import json
 import random
 import pytest
@@ -143,6 +144,30 @@ class TestOrchestratorInit:
         for real, anon in orch._name_map.items():
             assert orch._reverse_map[anon] == real
 
+    def test_deanon_name_ignores_case(self):
+        state = _make_state()
+        orch, _ = _make_orchestrator(state=state)
+        anon_alice = orch._name_map["Alice"]
+        assert orch._deanon_name(anon_alice.lower()) == "Alice"
+        assert orch._deanon_name(f" {anon_alice.upper()} ") == "Alice"
+        assert orch._deanon_name("Nobody") == "Nobody"
+        assert orch._deanon_name(None) is None
+
+    def test_anonymized_copies_reused_until_liked(self):
+        state = _make_state()
+        msg = Message.create(sender="Alice", content="Hi Bob")
+        state.add_message(msg)
+        orch, _ = _make_orchestrator(state=state)
+
+        first = orch._anonymize(msg)
+        assert orch._anonymize(msg) is first
+
+        msg.toggle_like("Bob")
+        assert first.liked_by == set()  # copy does not share the original's set
+        refreshed = orch._anonymize(msg)
+        assert refreshed is not first
+        assert refreshed.liked_by == {orch._name_map["Bob"]}
+
     def test_deterministic_with_seed(self):
         state = _make_state()
         orch1, _ = _make_orchestrator(state=state, rng=random.Random(42))
@@ -247,6 +272,75 @@ class TestUpdateEvaluateAndAct:
         # Alice's profile updated
         assert orch.agent_profiles[anon_alice] == "Alice opened with a friendly greeting."
 
+    @pytest.mark.asyncio
+    async def test_evaluate_window_wider_than_action_window(self):
+        """Evaluate sees its full window, anonymized, when it extends past the Action window."""
+        state = _make_state()
+        msgs = [
+            Message.create(sender="Alice" if i % 2 else "Bob", content=f"note {i} for Alice")
+            for i in range(5)
+        ]
+        for m in msgs:
+            state.add_message(m)
+
+        orch, logger = _make_orchestrator(state=state)
+        orch.action_window_size = 2
+        anon_bob = orch._name_map["Bob"]
+
+        orch.director_llm.generate_response = AsyncMock(
+            side_effect=[
+                _evaluate_json(),
+                _action_json(next_performer=anon_bob, action_type="message"),
+            ]
+        )
+        orch.performer_llm.generate_response = AsyncMock(return_value="Hi")
+        orch.moderator_llm.generate_response = AsyncMock(return_value="Hi")
+
+        await orch.execute_turn("criteria_A")
+
+        evaluate_prompt = orch.director_llm.generate_response.call_args_list[0][0][0]
+        for m in msgs:
+            assert m.message_id in evaluate_prompt
+        assert "Alice" not in evaluate_prompt
+        assert evaluate_prompt.index(msgs[0].message_id) < evaluate_prompt.index(msgs[4].message_id)
+
+    @pytest.mark.asyncio
+    async def test_update_and_evaluate_run_concurrently(self):
+        """Evaluate is dispatched while Update is still awaiting its LLM call."""
+        state = _make_state()
+        state.add_message(Message.create(sender="Alice", content="First message"))
+
+        orch, logger = _make_orchestrator(state=state)
+        anon_alice = orch._name_map["Alice"]
+        anon_bob = orch._name_map["Bob"]
+        orch._last_agent = anon_alice
+        orch._turns_since_evaluate = orch.evaluate_interval - 1
+
+        evaluate_started = asyncio.Event()
+        responses = iter([
+            _update_json(), _evaluate_json(),
+            _action_json(next_performer=anon_bob, action_type="message"),
+        ])
+
+        async def director(prompt, **kwargs):
+            resp = next(responses)
+            if "performer_profile_update" in resp:
+                # Deadlocks (and times out) if Evaluate only starts after Update.
+                await asyncio.wait_for(evaluate_started.wait(), timeout=1)
+            elif "internal_validity_evaluation" in resp:
+                evaluate_started.set()
+            return resp
+
+        orch.director_llm.generate_response = AsyncMock(side_effect=director)
+        orch.performer_llm.generate_response = AsyncMock(return_value="Hey there!")
+        orch.moderator_llm.generate_response = AsyncMock(return_value="Hey there!")
+
+        result = await orch.execute_turn("criteria_A")
+
+        assert result is not None
+        assert orch.director_llm.generate_response.call_count == 3
+        assert orch.agent_profiles[anon_alice] == "Active participant with neutral stance."
+
     @pytest.mark.asyncio
     async def test_update_failure_does_not_block_evaluate_and_act(self):
         """If Update fails, Evaluate and Act should still proceed."""
@@ -457,6 +551,28 @@ class TestExecuteTurnMention:
         assert result.message.content.startswith("@Bob")
         assert result.message.mentions == ["Bob"]
 
+    @pytest.mark.asyncio
+    async def test_mention_strips_duplicate_prefix(self):
+        state = _make_state()
+        orch, _ = _make_orchestrator(state=state)
+        anon_alice = orch._name_map["Alice"]
+        anon_bob = orch._name_map["Bob"]
+
+        action_resp = _action_json(
+            next_performer=anon_alice,
+            action_type="@mention",
+            target_user=anon_bob,
+        )
+        orch.director_llm.generate_response = AsyncMock(return_value=action_resp)
+        orch.performer_llm.generate_response = AsyncMock(return_value="x")
+        orch.moderator_llm.generate_response = AsyncMock(
+            return_value=f"@{anon_bob}  what do you think?",
+        )
+
+        result = await orch.execute_turn("criteria_A")
+
+        assert result.message.content == "@Bob what do you think?"
+
 
 # ── execute_turn: wait (yield to participant) ────────────────────────────────
 
@@ -652,6 +768,38 @@ class TestExecuteTurnErrors:
         assert result.agent_name in ("Alice", "Bob")
         logger.log_error.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_null_next_performer_falls_back(self):
+        """A null next_performer takes the unknown-agent path, not an exception."""
+        state = _make_state()
+        orch, logger = _make_orchestrator(state=state)
+
+        action_resp = _action_json(next_performer=None, action_type="message")
+        orch.director_llm.generate_response = AsyncMock(return_value=action_resp)
+        orch.performer_llm.generate_response = AsyncMock(return_value="Hi")
+        orch.moderator_llm.generate_response = AsyncMock(return_value="Hi")
+
+        result = await orch.execute_turn("criteria_A")
+        assert result is not None
+        assert result.agent_name in ("Alice", "Bob")
+        assert any(
+            "unknown agent" in str(c.args[1]) for c in logger.log_error.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent_fallback_is_seeded(self):
+        """The fallback agent comes from the session RNG, so seeded runs agree."""
+        chosen = []
+        for _ in range(2):
+            orch, _ = _make_orchestrator(state=_make_state(), rng=random.Random(7))
+            action_resp = _action_json(next_performer="UnknownAgent", action_type="message")
+            orch.director_llm.generate_response = AsyncMock(return_value=action_resp)
+            orch.performer_llm.generate_response = AsyncMock(return_value="Hi")
+            orch.moderator_llm.generate_response = AsyncMock(return_value="Hi")
+            random.seed()  # the global RNG must not matter
+            chosen.append((await orch.execute_turn("criteria_A")).agent_name)
+        assert chosen[0] == chosen[1]
+
 
 # ── Performer retry logic ────────────────────────────────────────────────────
 
@@ -715,6 +863,25 @@ class TestPerformerRetry:
         assert result is not None
         assert result.message.content == "Cleaned output"
 
+    @pytest.mark.asyncio
+    async def test_blank_performer_output_skips_moderator(self):
+        """Whitespace / NO_CONTENT performer output is retried without a Moderator call."""
+        state = _make_state()
+        orch, logger = _make_orchestrator(state=state)
+        anon_alice = orch._name_map["Alice"]
+
+        action_resp = _action_json(next_performer=anon_alice, action_type="message")
+        orch.director_llm.generate_response = AsyncMock(return_value=action_resp)
+
+        orch.performer_llm.generate_response = AsyncMock(
+            side_effect=["   \n", "NO_CONTENT", "real output"]
+        )
+        orch.moderator_llm.generate_response = AsyncMock(return_value="real output")
+
+        result = await orch.execute_turn("criteria_A")
+        assert result is not None
+        assert result.message.content == "real output"
+        assert orch.moderator_llm.generate_response.call_count == 1
 
 # ── Deanonymization in output ────────────────────────────────────────────────
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 import asyncio
 import json
 import pytest
+from unittest.mock import AsyncMock, MagicMock
+
 from cache import redis_client
 
 
@@ -60,3 +62,31 @@ async def test_publish_and_subscribe(fake_redis):
     assert len(received) == 2
     assert received[0]["msg"] == "hello"
     assert received[1]["msg"] == "world"
+
+
+async def test_push_pre_encoded_payload(fake_redis):
+    payload = redis_client.encode({"seq": 1})
+    await redis_client.push_to_window(fake_redis, "sess-5", payload)
+
+    assert await redis_client.get_window(fake_redis, "sess-5") == [{"seq": 1}]
+
+
+async def test_run_session_op_reports_success(fake_redis):
+    logger = MagicMock()
+    ok = await redis_client.run_session_op(
+        logger, "push", redis_client.push_to_window, "sess-op", {"seq": 1},
+        get_client=lambda: fake_redis,
+    )
+    assert ok is True
+    assert await redis_client.get_window(fake_redis, "sess-op") == [{"seq": 1}]
+    logger.log_error.assert_not_called()
+
+
+async def test_run_session_op_logs_failure():
+    logger = MagicMock()
+    op = AsyncMock(side_effect=RuntimeError("Redis down"))
+    ok = await redis_client.run_session_op(
+        logger, "publish_x", op, "sess-op", "{}", get_client=MagicMock,
+    )
+    assert ok is False
+    logger.log_error.assert_called_once_with("publish_x", "Redis down")
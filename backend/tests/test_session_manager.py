@@ -0,0 +1,49 @@
+"""Tests for SessionManager pending reservations (utils/session_manager.py)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from utils import session_manager as sm
+
+
+@pytest.fixture
+def manager():
+    with patch("utils.session_manager.db_conn") as mock_db, \
+         patch("utils.session_manager.session_repo") as mock_session_repo:
+        mock_db.get_pool.return_value = MagicMock()
+        mock_session_repo.create_session = AsyncMock()
+        yield sm.SessionManager()
+
+
+async def _reserve(manager, session_id):
+    await manager.reserve_pending(
+        session_id, {"treatment_group": "control"}, experiment_id="exp",
+    )
+
+
+class TestPendingReservations:
+
+    async def test_pop_returns_reservation(self, manager):
+        await _reserve(manager, "s1")
+        info = await manager.pop_pending("s1")
+        assert info["treatment_group"] == "control"
+        assert info["experiment_id"] == "exp"
+        assert await manager.pop_pending("s1") == {}
+
+    async def test_expired_reservation_is_not_returned(self, manager):
+        with patch("utils.session_manager.time.monotonic", return_value=1000.0):
+            await _reserve(manager, "s1")
+        with patch("utils.session_manager.time.monotonic",
+                   return_value=1000.0 + sm.PENDING_TTL_SECONDS + 1):
+            assert await manager.pop_pending("s1") == {}
+
+    async def test_reserve_prunes_abandoned_reservations(self, manager):
+        with patch("utils.session_manager.time.monotonic", return_value=1000.0):
+            await _reserve(manager, "old")
+        with patch("utils.session_manager.time.monotonic", return_value=1100.0):
+            await _reserve(manager, "recent")
+        with patch("utils.session_manager.time.monotonic",
+                   return_value=1000.0 + sm.PENDING_TTL_SECONDS + 1):
+            await _reserve(manager, "new")
+        assert list(manager._pending) == ["recent", "new"]
@@ -44,6 +44,60 @@ class TestAddMessage:
         assert s.messages[1].message_id == "m2"
 
 
+# ── get_message ──────────────────────────────────────────────────────────────
+
+class TestGetMessage:
+    def test_returns_message_by_id(self):
+        s = _make_session()
+        msg = _make_msg(msg_id="m7")
+        s.add_message(msg)
+        assert s.get_message("m7") is msg
+
+    def test_unknown_id_returns_none(self):
+        s = _make_session()
+        assert s.get_message("missing") is None
+
+    def test_indexes_initial_messages(self):
+        msg = _make_msg(msg_id="m1")
+        s = _make_session(messages=[msg])
+        assert s.get_message("m1") is msg
+
+
+# ── last_message_from ────────────────────────────────────────────────────────
+
+class TestLastMessageFrom:
+    def test_tracks_latest_per_sender(self):
+        s = _make_session()
+        s.add_message(_make_msg(sender="Alice", msg_id="m1"))
+        s.add_message(_make_msg(sender="Bob", msg_id="m2"))
+        s.add_message(_make_msg(sender="Alice", msg_id="m3"))
+        assert s.last_message_from("Alice").message_id == "m3"
+        assert s.last_message_from("Bob").message_id == "m2"
+
+    def test_unknown_sender_returns_none(self):
+        s = _make_session()
+        assert s.last_message_from("participant") is None
+
+    def test_indexes_initial_messages(self):
+        s = _make_session(messages=[_make_msg(sender="participant", msg_id="m1")])
+        assert s.last_message_from("participant").message_id == "m1"
+
+
+class TestRecentMessagesFrom:
+    def test_returns_last_n_for_sender_oldest_first(self):
+        s = _make_session()
+        for i in range(6):
+            s.add_message(_make_msg(sender="Alice" if i % 2 == 0 else "Bob", msg_id=f"m{i}"))
+        recent = s.recent_messages_from("Alice", 2)
+        assert [m.message_id for m in recent] == ["m2", "m4"]
+
+    def test_zero_or_unknown_sender_returns_empty(self):
+        s = _make_session()
+        s.add_message(_make_msg(sender="Alice", msg_id="m1"))
+        assert s.recent_messages_from("Alice", 0) == []
+        assert s.recent_messages_from("Bob", 3) == []
+
+
 # ── get_recent_messages ──────────────────────────────────────────────────────
 
 class TestGetRecentMessages:
@@ -134,6 +188,18 @@ class TestAgentBlocking:
         assert "Bob" in s.blocked_agents
 
 
+# ── get_agent ────────────────────────────────────────────────────────────────
+
+class TestGetAgent:
+    def test_returns_agent_by_name(self):
+        s = _make_session()
+        assert s.get_agent("Bob") is s.agents[1]
+
+    def test_unknown_name_returns_none(self):
+        s = _make_session()
+        assert s.get_agent("Nobody") is None
+
+
 # ── defaults ─────────────────────────────────────────────────────────────────
 
 class TestDefaults:
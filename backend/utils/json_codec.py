@@ -0,0 +1,40 @@
+"""JSON encoding for the real-time paths (Redis pub/sub, WebSocket frames).
+
+Uses ``orjson`` when it is installed (``pip install .[speedups]``) and falls
+back to the standard library otherwise.  Both produce compact JSON text that
+any JSON consumer reads the same way.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Raised by loads() on malformed input (orjson's error subclasses this).
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        """Serialise *obj* to a JSON string."""
+        return orjson.dumps(obj, option=_OPTIONS).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON string or bytes."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> str:
+        """Serialise *obj* to a JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON string or bytes."""
+        return json.loads(data)
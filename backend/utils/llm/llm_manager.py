@@ -1,5 +1,5 @@
 import asyncio
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 def _create_client(provider: str, model: str = None, temperature: float = None, top_p: float = None, max_tokens: int = None):
@@ -44,6 +44,41 @@ def _create_client(provider: str, model: str = None, temperature: float = None,
         raise RuntimeError(f"Unknown llm_provider: '{provider}'. Supported: 'gemini', 'huggingface', 'anthropic', 'mistral', 'konstanz', 'local', 'None' (on-device)")
 
 
+# API clients shared across sessions, keyed by their full configuration.
+# Each owns an HTTP connection pool that is safe for concurrent requests, so
+# sessions with the same settings reuse one instead of building their own.
+_client_cache: Dict[Tuple, object] = {}
+
+# Providers whose clients are never shared: the on-device model runs in
+# executor threads with no locking, so each session keeps its own instance.
+_UNSHARED_PROVIDERS = frozenset({"none"})
+
+
+def _get_client(
+    provider: str,
+    model: str = None,
+    temperature: float = None,
+    top_p: float = None,
+    max_tokens: int = None,
+):
+    """Return the shared client for these settings, creating it on first use.
+
+    On-device providers (see _UNSHARED_PROVIDERS) get a fresh client per call.
+    """
+    key = ((provider or "gemini").lower(), model, temperature, top_p, max_tokens)
+    if key[0] in _UNSHARED_PROVIDERS:
+        return _create_client(
+            provider, model, temperature=temperature, top_p=top_p, max_tokens=max_tokens,
+        )
+    client = _client_cache.get(key)
+    if client is None:
+        client = _create_client(
+            provider, model, temperature=temperature, top_p=top_p, max_tokens=max_tokens,
+        )
+        _client_cache[key] = client
+    return client
+
+
 def _create_client_from_config(simulation_config: dict):
     """Create the appropriate LLM client based on simulation config.
 
@@ -56,14 +91,19 @@ def _create_client_from_config(simulation_config: dict):
     temperature = simulation_config.get("temperature")
     top_p = simulation_config.get("top_p")
     max_tokens = simulation_config.get("max_tokens")
-    return _create_client(provider, model, temperature=temperature, top_p=top_p, max_tokens=max_tokens)
+    return _get_client(provider, model, temperature=temperature, top_p=top_p, max_tokens=max_tokens)
 
 
 class LLMManager:
     """Generic LLM manager that delegates calls to an injected client.
 
-    Turns are serialised at the session level (chatroom._turn_lock), so
-    there is no need for a per-manager concurrency semaphore.
+    Calls can overlap. Turns are serialised per session (chatroom._turn_lock),
+    but within a turn the Director's Update and Evaluate calls run concurrently
+    on the same manager. API clients are also shared across sessions (see
+    _client_cache). No per-manager semaphore is applied: the provider SDKs'
+    HTTP pools handle concurrent requests, and the on-device client, which
+    cannot, is never shared between sessions and runs one generation at a
+    time.
     """
 
     def __init__(self, client: Optional[object] = None):
@@ -85,7 +125,10 @@ class LLMManager:
                 top_p = simulation_config.get(f"{role}_top_p")
                 max_tokens = simulation_config.get(f"{role}_max_tokens")
                 if provider:
-                    client = _create_client(provider, model, temperature=temperature, top_p=top_p, max_tokens=max_tokens)
+                    client = _get_client(
+                        provider, model,
+                        temperature=temperature, top_p=top_p, max_tokens=max_tokens,
+                    )
             if client is None:
                 client = _create_client_from_config(simulation_config)
         return cls(client=client)
@@ -24,6 +24,9 @@ class SalamandraClient:
         self.model_name = model_name
         self.temperature = temperature
         self.max_new_tokens = max_tokens
+        # One generation at a time: the model is not safe to run from
+        # several executor threads at once.
+        self._generate_lock = asyncio.Lock()
 
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
 
@@ -117,11 +120,15 @@ class SalamandraClient:
         return None
 
     async def generate_response_async(self, prompt: str, max_retries: int = 1, system_prompt: str = None) -> Optional[str]:
-        """Async wrapper — runs the blocking generate in a thread pool."""
+        """Async wrapper — runs the blocking generate in a thread pool, one call at a time."""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, lambda: self.generate_response(prompt, max_retries=max_retries, system_prompt=system_prompt)
-        )
+        async with self._generate_lock:
+            return await loop.run_in_executor(
+                None,
+                lambda: self.generate_response(
+                    prompt, max_retries=max_retries, system_prompt=system_prompt,
+                ),
+            )
 
     def close(self) -> None:
         """Release model from memory."""
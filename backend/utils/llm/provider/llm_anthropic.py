@@ -8,6 +8,16 @@ from typing import Optional
 load_dotenv()
 
 
+def _cached_system(system_prompt: str) -> list:
+    """Wrap a system prompt as a content block marked for prompt caching.
+
+    STAGE system prompts are session-static, so marking them lets Anthropic
+    serve the prefix from its prompt cache on every later call.  Prompts
+    below the model's minimum cacheable length are simply not cached.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
 class AnthropicClient:
     """Client for interacting with the Anthropic API (sync + async)."""
 
@@ -42,7 +52,7 @@ class AnthropicClient:
                     ],
                 )
                 if system_prompt is not None:
-                    kwargs["system"] = system_prompt
+                    kwargs["system"] = _cached_system(system_prompt)
                 if self.temperature is not None:
                     kwargs["temperature"] = self.temperature
                 elif self.top_p is not None:
@@ -76,7 +86,7 @@ class AnthropicClient:
                         ],
                     )
                     if system_prompt is not None:
-                        kwargs["system"] = system_prompt
+                        kwargs["system"] = _cached_system(system_prompt)
                     if self.temperature is not None:
                         kwargs["temperature"] = self.temperature
                     elif self.top_p is not None:
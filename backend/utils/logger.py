@@ -1,8 +1,9 @@
 """Database-backed event logger.
 
 Keeps the same public interface as the old file-based Logger so no call sites
-need signature changes.  All methods are synchronous; they schedule a
-fire-and-forget asyncio task to write to the ``events`` table.
+need signature changes.  All methods are synchronous; they buffer the event
+and schedule a fire-and-forget asyncio task that writes everything logged in
+the meantime to the ``events`` table in one batch.
 
 Critical operational errors are also written to ``logs/errors.jsonl`` as a
 fallback in case the DB is unreachable.
@@ -41,8 +42,9 @@ class Logger:
         log_dir.mkdir(exist_ok=True)
         self._error_log = log_dir / "errors.jsonl"
 
-        # Track pending fire-and-forget tasks so drain() can await them.
-        self._pending_tasks: set = set()
+        # Events logged since the last flush, and the task that will flush them.
+        self._buffer: list = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     # ── Public interface ──────────────────────────────────────────────────────
 
@@ -79,10 +81,21 @@ class Logger:
     def log_llm_call(
         self,
         agent_name: str,
-        prompt: str,
-        response: str,
+        prompt: Optional[str] = None,
+        response: Optional[str] = None,
         error: Optional[str] = None,
+        *,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
     ) -> None:
+        """Log one LLM call.
+
+        Callers may pass the system and user prompts separately instead of
+        a pre-joined *prompt*; they are combined here into the stored
+        ``[SYSTEM] ... [USER] ...`` form.
+        """
+        if prompt is None:
+            prompt = f"[SYSTEM]\n{system_prompt or ''}\n\n[USER]\n{user_prompt or ''}"
         self.log_event("llm_call", {
             "agent_name": agent_name,
             "prompt": prompt,
@@ -109,22 +122,38 @@ class Logger:
     # ── Internal helpers ──────────────────────────────────────────────────────
 
     def _schedule(self, event_type: str, data: Any) -> None:
-        """Schedule an async DB insert without blocking the caller."""
+        """Buffer an event and make sure a flush task will write it."""
         try:
             loop = asyncio.get_running_loop()
-            task = loop.create_task(self._async_insert(event_type, data))
-            self._pending_tasks.add(task)
-            task.add_done_callback(self._pending_tasks.discard)
         except RuntimeError:
             # No running event loop (e.g. called from a sync test context).
             # Fall through silently — tests that care about events should use
             # awaited repo calls directly.
-            pass
+            return
+        self._buffer.append((event_type, data))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """Write buffered events until the buffer is empty.
+
+        Events logged in the same loop iteration (or while a previous batch
+        is being written) go out together on a single connection.
+        """
+        try:
+            while self._buffer:
+                batch, self._buffer = self._buffer, []
+                if len(batch) == 1:
+                    await self._async_insert(*batch[0])
+                else:
+                    await self._async_insert_many(batch)
+        finally:
+            self._flush_task = None
 
     async def drain(self) -> None:
-        """Await all pending log tasks (call during session shutdown to prevent data loss)."""
-        if self._pending_tasks:
-            await asyncio.gather(*list(self._pending_tasks), return_exceptions=True)
+        """Await all pending log writes (call during session shutdown to prevent data loss)."""
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
 
     async def _async_insert(self, event_type: str, data: Any) -> None:
         """Perform the actual DB insert (runs as a background task)."""
@@ -145,6 +174,24 @@ class Logger:
                 file=sys.stderr,
             )
 
+    async def _async_insert_many(self, events: list) -> None:
+        """Insert a batch of (event_type, data) pairs in one round trip."""
+        try:
+            from db.connection import get_pool
+            from db.repositories.event_repo import insert_events
+            await insert_events(
+                get_pool(),
+                session_id=self.session_id,
+                experiment_id=self.experiment_id,
+                events=events,
+            )
+        except Exception as exc:
+            # Last-resort stderr output; never raise from a background task.
+            print(
+                f"[Logger] DB insert failed for {len(events)} events: {exc}",
+                file=sys.stderr,
+            )
+
     # ── Admin / system events (no session context) ────────────────────────────
 
     @staticmethod
@@ -23,14 +23,19 @@ from __future__ import annotations
 
 import asyncio
 import json as _json
+import time
 from datetime import datetime, timezone
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from platforms import SimulationSession
 from db import connection as db_conn
 from db.repositories import session_repo, message_repo, config_repo
 from cache import redis_client
 
+# Seconds a reservation from POST /session/start waits for its WebSocket
+# before it is dropped.  Abandoned reservations would otherwise pile up.
+PENDING_TTL_SECONDS = 600
+
 
 class SessionManager:
     """Singleton manager for concurrent simulation sessions."""
@@ -39,7 +44,8 @@ class SessionManager:
 
     def __init__(self) -> None:
         self._sessions: Dict[str, SimulationSession] = {}
-        self._pending: Dict[str, Dict] = {}
+        # session_id -> (reserved_at monotonic time, info), in reservation order.
+        self._pending: Dict[str, Tuple[float, Dict]] = {}
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -63,7 +69,10 @@ class SessionManager:
         survives an unlikely worker restart between HTTP and WebSocket steps.
         """
         async with self._lock:
-            self._pending[session_id] = {**info, "experiment_id": experiment_id}
+            now = time.monotonic()
+            self._prune_pending(now)
+            self._pending.pop(session_id, None)  # re-reserving moves it to the end
+            self._pending[session_id] = (now, {**info, "experiment_id": experiment_id})
 
         pool = db_conn.get_pool()
         await session_repo.create_session(
@@ -77,7 +86,23 @@ class SessionManager:
 
     async def pop_pending(self, session_id: str) -> Dict:
         async with self._lock:
-            return self._pending.pop(session_id, {})
+            entry = self._pending.pop(session_id, None)
+        if entry is None or time.monotonic() - entry[0] > PENDING_TTL_SECONDS:
+            return {}
+        return entry[1]
+
+    def _prune_pending(self, now: float) -> None:
+        """Drop reservations older than PENDING_TTL_SECONDS.
+
+        Entries are kept in reservation order, so pruning stops at the first
+        one still within its TTL.
+        """
+        cutoff = now - PENDING_TTL_SECONDS
+        while self._pending:
+            session_id, (reserved_at, _) = next(iter(self._pending.items()))
+            if reserved_at > cutoff:
+                break
+            del self._pending[session_id]
 
     # ── Session lifecycle ─────────────────────────────────────────────────────
 
@@ -134,9 +159,11 @@ class SessionManager:
 
         Does NOT attempt cross-worker reconstruction — callers that need that
         should use ``get_or_reconstruct()``.
+
+        Lock-free: a single dict read cannot interleave with the writers,
+        none of which await while holding ``_lock``.
         """
-        async with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     async def get_or_reconstruct(
         self,
@@ -277,8 +304,8 @@ class SessionManager:
             print(f"[SessionManager] Redis invalidation failed for {session_id}: {exc}")
 
     async def list_sessions(self) -> Dict[str, SimulationSession]:
-        async with self._lock:
-            return dict(self._sessions)
+        # Lock-free snapshot, as in get_session().
+        return dict(self._sessions)
 
 
 session_manager = SessionManager.get()
@@ -45,6 +45,11 @@ export function useWebSocket({
             ws.send(JSON.stringify({ type: "pong" }))
             return
           }
+          // Unpack batched frames (e.g. history replay on reconnect).
+          if (obj.type === "batch" && Array.isArray(obj.messages)) {
+            for (const m of obj.messages) onMessageRef.current(m)
+            return
+          }
           onMessageRef.current(obj)
         } catch (e) {
           console.error("Failed to parse WebSocket message:", e)